@@ -1,4 +1,6 @@
+import io
 import sys
+from contextlib import redirect_stdout
 from pathlib import Path
 from typing import Dict, List, Tuple
 from dataclasses import dataclass
@@ -10,6 +12,7 @@ from src.exec.exec_context import ExecContext
 from src.exec import solve
 from src.exec.status import Status
 from src.utils.program_logging import Colors
+from src.bonus.reasoning_visualization import visualize_reasoning
 
 
 @dataclass
@@ -18,6 +21,7 @@ class TestCase:
     file_path: Path
     expected_results: Dict[str, Status]
     description: str
+    reasoning: bool = False
 
 
 def run_test(test_case: TestCase) -> Tuple[bool, str, Dict[str, Status], Dict[str, Status]]:
@@ -47,6 +51,11 @@ def run_test(test_case: TestCase) -> Tuple[bool, str, Dict[str, Status], Dict[st
             if query not in test_case.expected_results:
                 return False, f"Unexpected query result: {query} = {results[query].name}", test_case.expected_results, results
 
+        # Explain the results as -r does, discarding the printed explanations
+        if test_case.reasoning:
+            with redirect_stdout(io.StringIO()):
+                visualize_reasoning(ctx, program, results)
+
         return True, "PASS", test_case.expected_results, results
 
     except Exception as e:
@@ -100,6 +109,17 @@ def main():
             {"D": Status.TRUE},
             "AND: With parentheses"
         ),
+        TestCase(
+            rules_dir / "AND_rules/test9_long_chain.rule",
+            {"Z": Status.TRUE},
+            "AND: Long chain of 3000 terms"
+        ),
+        TestCase(
+            rules_dir / "AND_rules/test9_long_chain.rule",
+            {"Z": Status.TRUE},
+            "AND: Long chain of 3000 terms, with reasoning",
+            reasoning=True
+        ),
 
         # OR operator tests
         TestCase(
@@ -291,6 +311,17 @@ def main():
             {"B": Status.TRUE, "D": Status.TRUE, "F": Status.TRUE, "H": Status.TRUE},
             "MIXED: Chain of implications"
         ),
+        TestCase(
+            rules_dir / "MIXED_rules/test9_very_deep_nesting.rule",
+            {"Z": Status.TRUE},
+            "MIXED: 2500 levels of nested parentheses"
+        ),
+        TestCase(
+            rules_dir / "MIXED_rules/test9_very_deep_nesting.rule",
+            {"Z": Status.TRUE},
+            "MIXED: 2500 levels of nested parentheses, with reasoning",
+            reasoning=True
+        ),
 
         # IIF (biconditional) operator tests
         TestCase(
@@ -5,15 +5,18 @@ Provides human-readable explanations of how the system arrived at conclusions.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Dict, Set
+from typing import TYPE_CHECKING, List, Dict, Set, Tuple
 from dataclasses import dataclass
 
 if TYPE_CHECKING:
     from src.parsing.parser import Program, Rule
     from src.exec import Condition
-    from src.exec.status import Status
     from src.exec.exec_context import ExecContext
 
+from src.exec import AndCondition, FactCondition, NotCondition, OrCondition, XorCondition
+from src.exec.eval_condition import eval_condition
+from src.exec.format_condition import format_condition
+from src.exec.status import Status
 from src.utils.program_logging import Colors
 
 
@@ -34,6 +37,17 @@ class ReasoningVisualizer:
         self.ctx = ctx
         self.program = program
         self.explanations: List[str] = []
+        # Display strings of the conditions already formatted, by id(); each entry
+        # keeps its node alive so the id cannot be reused while cached
+        self._formatted: Dict[int, Tuple["Condition", str]] = {}
+
+    def _format(self, condition: "Condition") -> str:
+        """format_condition(), computed once per condition node."""
+        entry = self._formatted.get(id(condition))
+        if entry is None:
+            entry = (condition, format_condition(condition))
+            self._formatted[id(condition)] = entry
+        return entry[1]
 
     def explain_query(self, symbol: str, result: "Status") -> str:
         """
@@ -46,8 +60,6 @@ class ReasoningVisualizer:
         Returns:
             Human-readable explanation string
         """
-        from src.exec.status import Status
-
         explanation_lines = []
 
         # Header
@@ -80,11 +92,8 @@ class ReasoningVisualizer:
         # Find the rule that proved it
         rules = self.ctx.rules_by_conclusion.get(symbol, [])
         for rule in rules:
-            from src.exec.eval_condition import eval_condition
-            from src.exec.status import Status
-
             # Check if this rule fired
-            condition_status = eval_condition(self.ctx, rule.condition, depth=0)
+            condition_status = eval_condition(self.ctx, rule.condition)
             if condition_status == Status.TRUE:
                 explanation.append(self._explain_rule_firing(symbol, rule))
                 break
@@ -105,12 +114,8 @@ class ReasoningVisualizer:
         negated_by_rule = False
 
         for rule in rules:
-            from src.exec import NotCondition
             if isinstance(rule.conclusion, NotCondition):
-                from src.exec.eval_condition import eval_condition
-                from src.exec.status import Status
-
-                condition_status = eval_condition(self.ctx, rule.condition, depth=0)
+                condition_status = eval_condition(self.ctx, rule.condition)
                 if condition_status == Status.TRUE:
                     explanation.append(self._explain_negation_rule(symbol, rule))
                     negated_by_rule = True
@@ -125,13 +130,9 @@ class ReasoningVisualizer:
                 explanation.append("")
 
                 for rule in rules_for_symbol:
-                    from src.exec.format_condition import format_condition
-                    from src.exec.eval_condition import eval_condition
-                    from src.exec.status import Status
-
-                    condition_str = format_condition(rule.condition)
-                    conclusion_str = format_condition(rule.conclusion)
-                    condition_status = eval_condition(self.ctx, rule.condition, depth=0)
+                    condition_str = self._format(rule.condition)
+                    conclusion_str = self._format(rule.conclusion)
+                    condition_status = eval_condition(self.ctx, rule.condition)
 
                     explanation.append(f"  Rule: {condition_str} => {conclusion_str}")
                     if condition_status == Status.FALSE:
@@ -166,12 +167,8 @@ class ReasoningVisualizer:
         # Check for OR/XOR in conclusions
         rules = self.ctx.rules_by_conclusion.get(symbol, [])
         for rule in rules:
-            from src.exec import OrCondition, XorCondition
             if isinstance(rule.conclusion, (OrCondition, XorCondition)):
-                from src.exec.eval_condition import eval_condition
-                from src.exec.status import Status
-
-                condition_status = eval_condition(self.ctx, rule.condition, depth=0)
+                condition_status = eval_condition(self.ctx, rule.condition)
                 if condition_status == Status.TRUE:
                     explanation.append(self._explain_ambiguous_conclusion(symbol, rule))
                     break
@@ -185,10 +182,8 @@ class ReasoningVisualizer:
 
     def _explain_rule_firing(self, symbol: str, rule: "Rule") -> str:
         """Explain how a rule proves a symbol."""
-        from src.exec.format_condition import format_condition
-
-        condition_str = format_condition(rule.condition)
-        conclusion_str = format_condition(rule.conclusion)
+        condition_str = self._format(rule.condition)
+        conclusion_str = self._format(rule.conclusion)
 
         # Explain the condition
         condition_explanation = self._explain_condition(rule.condition)
@@ -203,10 +198,8 @@ class ReasoningVisualizer:
 
     def _explain_negation_rule(self, symbol: str, rule: "Rule") -> str:
         """Explain how a rule proves a symbol is false."""
-        from src.exec.format_condition import format_condition
-
-        condition_str = format_condition(rule.condition)
-        conclusion_str = format_condition(rule.conclusion)
+        condition_str = self._format(rule.condition)
+        conclusion_str = self._format(rule.conclusion)
 
         condition_explanation = self._explain_condition(rule.condition)
 
@@ -220,11 +213,8 @@ class ReasoningVisualizer:
 
     def _explain_ambiguous_conclusion(self, symbol: str, rule: "Rule") -> str:
         """Explain why a conclusion is ambiguous."""
-        from src.exec.format_condition import format_condition
-        from src.exec import OrCondition, XorCondition
-
-        condition_str = format_condition(rule.condition)
-        conclusion_str = format_condition(rule.conclusion)
+        condition_str = self._format(rule.condition)
+        conclusion_str = self._format(rule.conclusion)
 
         condition_explanation = self._explain_condition(rule.condition)
 
@@ -246,14 +236,10 @@ class ReasoningVisualizer:
         # Find the rule that proved this symbol
         rules = self.ctx.rules_by_conclusion.get(symbol, [])
         for rule in rules:
-            from src.exec.eval_condition import eval_condition
-            from src.exec.status import Status
-            from src.exec.format_condition import format_condition
-
-            condition_status = eval_condition(self.ctx, rule.condition, depth=0)
+            condition_status = eval_condition(self.ctx, rule.condition)
             if condition_status == Status.TRUE:
-                condition_str = format_condition(rule.condition)
-                conclusion_str = format_condition(rule.conclusion)
+                condition_str = self._format(rule.condition)
+                conclusion_str = self._format(rule.conclusion)
 
                 # Recursively explain the condition
                 condition_explanation = self._explain_condition(rule.condition)
@@ -270,15 +256,10 @@ class ReasoningVisualizer:
         # Check if negated by a rule
         rules = self.ctx.rules_by_conclusion.get(symbol, [])
         for rule in rules:
-            from src.exec import NotCondition
-            from src.exec.format_condition import format_condition
             if isinstance(rule.conclusion, NotCondition):
-                from src.exec.eval_condition import eval_condition
-                from src.exec.status import Status
-
-                condition_status = eval_condition(self.ctx, rule.condition, depth=0)
+                condition_status = eval_condition(self.ctx, rule.condition)
                 if condition_status == Status.TRUE:
-                    condition_str = format_condition(rule.condition)
+                    condition_str = self._format(rule.condition)
 
                     # Recursively explain the condition
                     condition_explanation = self._explain_condition(rule.condition)
@@ -288,9 +269,6 @@ class ReasoningVisualizer:
 
     def _collect_requirements(self, condition: "Condition", indent: int = 0) -> List[str]:
         """Recursively collect all requirements needed to satisfy a condition."""
-        from src.exec import FactCondition, AndCondition, OrCondition, XorCondition, NotCondition
-        from src.exec.format_condition import format_condition
-
         prefix = " " * indent
         lines = []
 
@@ -305,11 +283,10 @@ class ReasoningVisualizer:
                 if rules_for_symbol:
                     # Show the first rule that could prove it
                     for rule in rules_for_symbol:
-                        from src.exec import NotCondition as NC
-                        if isinstance(rule.conclusion, NC):
+                        if isinstance(rule.conclusion, NotCondition):
                             continue
 
-                        cond_str = format_condition(rule.condition)
+                        cond_str = self._format(rule.condition)
                         lines.append(f"{prefix}• {symbol} requires: {cond_str}")
                         # Recursively get requirements for this condition
                         inner_reqs = self._collect_requirements(rule.condition, indent + 2)
@@ -319,15 +296,14 @@ class ReasoningVisualizer:
                     lines.append(f"{prefix}✗ {symbol} (cannot be proven, not a fact)")
 
         elif isinstance(condition, NotCondition):
-            from src.exec import FactCondition as FC
-            if isinstance(condition.condition, FC):
+            if isinstance(condition.condition, FactCondition):
                 symbol = condition.condition.symbol
                 if self.ctx.is_fact_false(symbol) or self.ctx.get_status(symbol).name == 'FALSE':
                     lines.append(f"{prefix}✓ !{symbol} (already satisfied)")
                 else:
                     lines.append(f"{prefix}✗ !{symbol} ({symbol} must be false)")
             else:
-                cond_str = format_condition(condition.condition)
+                cond_str = self._format(condition.condition)
                 lines.append(f"{prefix}• NOT({cond_str})")
 
         elif isinstance(condition, AndCondition):
@@ -337,8 +313,8 @@ class ReasoningVisualizer:
             lines.extend(right_reqs)
 
         elif isinstance(condition, OrCondition):
-            left_str = format_condition(condition.left)
-            right_str = format_condition(condition.right)
+            left_str = self._format(condition.left)
+            right_str = self._format(condition.right)
             lines.append(f"{prefix}• Either {left_str} OR {right_str}:")
             lines.append(f"{prefix}  Option 1:")
             left_reqs = self._collect_requirements(condition.left, indent + 4)
@@ -348,19 +324,14 @@ class ReasoningVisualizer:
             lines.extend(right_reqs)
 
         elif isinstance(condition, XorCondition):
-            left_str = format_condition(condition.left)
-            right_str = format_condition(condition.right)
+            left_str = self._format(condition.left)
+            right_str = self._format(condition.right)
             lines.append(f"{prefix}• Exactly one of {left_str} XOR {right_str}")
 
         return lines
 
     def _explain_why_condition_false(self, condition: "Condition") -> str:
         """Explain why a condition is false."""
-        from src.exec import FactCondition, AndCondition, OrCondition, XorCondition, NotCondition
-        from src.exec.eval_condition import eval_condition
-        from src.exec.status import Status
-        from src.exec.format_condition import format_condition
-
         if isinstance(condition, FactCondition):
             symbol = condition.symbol
             status = self.ctx.get_status(symbol)
@@ -371,14 +342,13 @@ class ReasoningVisualizer:
                     # Find why the rules don't fire
                     reasons = []
                     for rule in rules_for_symbol:
-                        from src.exec import NotCondition as NC
-                        if isinstance(rule.conclusion, NC):
+                        if isinstance(rule.conclusion, NotCondition):
                             continue  # Skip negation rules
 
-                        cond_status = eval_condition(self.ctx, rule.condition, depth=0)
+                        cond_status = eval_condition(self.ctx, rule.condition)
                         if cond_status != Status.TRUE:
-                            cond_str = format_condition(rule.condition)
-                            conclusion_str = format_condition(rule.conclusion)
+                            cond_str = self._format(rule.condition)
+                            conclusion_str = self._format(rule.conclusion)
                             inner_reason = self._explain_why_condition_false(rule.condition)
                             reasons.append(f"{symbol} is false because rule '{cond_str} => {conclusion_str}' does not fire ({inner_reason})")
 
@@ -390,40 +360,40 @@ class ReasoningVisualizer:
                 return f"{symbol} is {status.name}"
 
         elif isinstance(condition, NotCondition):
-            inner_status = eval_condition(self.ctx, condition.condition, depth=0)
+            inner_status = eval_condition(self.ctx, condition.condition)
             if inner_status == Status.TRUE:
                 return f"The negation fails because the inner condition is true"
             return f"The negation status: {inner_status.name}"
 
         elif isinstance(condition, AndCondition):
-            left_status = eval_condition(self.ctx, condition.left, depth=0)
-            right_status = eval_condition(self.ctx, condition.right, depth=0)
+            left_status = eval_condition(self.ctx, condition.left)
+            right_status = eval_condition(self.ctx, condition.right)
 
             parts = []
             if left_status != Status.TRUE:
-                left_str = format_condition(condition.left)
+                left_str = self._format(condition.left)
                 left_reason = self._explain_why_condition_false(condition.left)
                 parts.append(f"{left_str} is {left_status.name} ({left_reason})")
             if right_status != Status.TRUE:
-                right_str = format_condition(condition.right)
+                right_str = self._format(condition.right)
                 right_reason = self._explain_why_condition_false(condition.right)
                 parts.append(f"{right_str} is {right_status.name} ({right_reason})")
 
             return " and ".join(parts) if parts else "AND condition is false"
 
         elif isinstance(condition, OrCondition):
-            left_status = eval_condition(self.ctx, condition.left, depth=0)
-            right_status = eval_condition(self.ctx, condition.right, depth=0)
+            left_status = eval_condition(self.ctx, condition.left)
+            right_status = eval_condition(self.ctx, condition.right)
 
             if left_status == Status.FALSE and right_status == Status.FALSE:
-                left_str = format_condition(condition.left)
-                right_str = format_condition(condition.right)
+                left_str = self._format(condition.left)
+                right_str = self._format(condition.right)
                 return f"Both {left_str} and {right_str} are false"
             return "OR condition is false"
 
         elif isinstance(condition, XorCondition):
-            left_status = eval_condition(self.ctx, condition.left, depth=0)
-            right_status = eval_condition(self.ctx, condition.right, depth=0)
+            left_status = eval_condition(self.ctx, condition.left)
+            right_status = eval_condition(self.ctx, condition.right)
 
             if left_status == right_status:
                 return f"XOR fails because both sides have the same status: {left_status.name}"
@@ -433,11 +403,6 @@ class ReasoningVisualizer:
 
     def _explain_why_condition_false_detailed(self, condition: "Condition", indent: int = 0) -> List[str]:
         """Explain why a condition is false with proper indentation."""
-        from src.exec import FactCondition, AndCondition, OrCondition, XorCondition, NotCondition
-        from src.exec.eval_condition import eval_condition
-        from src.exec.status import Status
-        from src.exec.format_condition import format_condition
-
         prefix = " " * indent
         lines = []
 
@@ -451,13 +416,12 @@ class ReasoningVisualizer:
                 has_positive_rule = False
 
                 for rule in rules_for_symbol:
-                    from src.exec import NotCondition as NC
-                    if not isinstance(rule.conclusion, NC):
+                    if not isinstance(rule.conclusion, NotCondition):
                         has_positive_rule = True
-                        cond_status = eval_condition(self.ctx, rule.condition, depth=0)
+                        cond_status = eval_condition(self.ctx, rule.condition)
                         if cond_status != Status.TRUE:
-                            cond_str = format_condition(rule.condition)
-                            conclusion_str = format_condition(rule.conclusion)
+                            cond_str = self._format(rule.condition)
+                            conclusion_str = self._format(rule.conclusion)
                             lines.append(f"{prefix}{symbol} is FALSE because rule '{cond_str} => {conclusion_str}' does not fire:")
                             inner_lines = self._explain_why_condition_false_detailed(rule.condition, indent + 2)
                             lines.extend(inner_lines)
@@ -473,14 +437,13 @@ class ReasoningVisualizer:
                     # Find the rule that proved it
                     rules_for_symbol = self.ctx.rules_by_conclusion.get(symbol, [])
                     for rule in rules_for_symbol:
-                        from src.exec import NotCondition as NC
-                        if isinstance(rule.conclusion, NC):
+                        if isinstance(rule.conclusion, NotCondition):
                             continue  # Skip negation rules for now
 
-                        cond_status = eval_condition(self.ctx, rule.condition, depth=0)
+                        cond_status = eval_condition(self.ctx, rule.condition)
                         if cond_status == Status.TRUE:
-                            cond_str = format_condition(rule.condition)
-                            conclusion_str = format_condition(rule.conclusion)
+                            cond_str = self._format(rule.condition)
+                            conclusion_str = self._format(rule.conclusion)
                             lines.append(f"{prefix}{symbol} is TRUE because rule '{cond_str} => {conclusion_str}' fires:")
                             inner_lines = self._explain_why_condition_true_detailed(rule.condition, indent + 2)
                             lines.extend(inner_lines)
@@ -489,50 +452,49 @@ class ReasoningVisualizer:
                 lines.append(f"{prefix}{symbol} is {status.name}")
 
         elif isinstance(condition, NotCondition):
-            from src.exec import FactCondition as FC
-            if isinstance(condition.condition, FC):
+            if isinstance(condition.condition, FactCondition):
                 symbol = condition.condition.symbol
                 status = self.ctx.get_status(symbol)
-                cond_str = format_condition(condition.condition)
+                cond_str = self._format(condition.condition)
                 lines.append(f"{prefix}!{symbol} is FALSE because {symbol} is {status.name}")
                 if status == Status.TRUE:
                     # Explain why the symbol is true
                     inner_lines = self._explain_why_condition_false_detailed(condition.condition, indent + 2)
                     lines.extend(inner_lines)
             else:
-                inner_status = eval_condition(self.ctx, condition.condition, depth=0)
+                inner_status = eval_condition(self.ctx, condition.condition)
                 lines.append(f"{prefix}Negation is FALSE (inner condition is {inner_status.name})")
 
         elif isinstance(condition, AndCondition):
-            left_status = eval_condition(self.ctx, condition.left, depth=0)
-            right_status = eval_condition(self.ctx, condition.right, depth=0)
+            left_status = eval_condition(self.ctx, condition.left)
+            right_status = eval_condition(self.ctx, condition.right)
 
             if left_status != Status.TRUE:
-                left_str = format_condition(condition.left)
+                left_str = self._format(condition.left)
                 lines.append(f"{prefix}AND fails because {left_str} is {left_status.name}:")
                 left_lines = self._explain_why_condition_false_detailed(condition.left, indent + 2)
                 lines.extend(left_lines)
 
             if right_status != Status.TRUE:
-                right_str = format_condition(condition.right)
+                right_str = self._format(condition.right)
                 lines.append(f"{prefix}AND fails because {right_str} is {right_status.name}:")
                 right_lines = self._explain_why_condition_false_detailed(condition.right, indent + 2)
                 lines.extend(right_lines)
 
         elif isinstance(condition, OrCondition):
-            left_status = eval_condition(self.ctx, condition.left, depth=0)
-            right_status = eval_condition(self.ctx, condition.right, depth=0)
+            left_status = eval_condition(self.ctx, condition.left)
+            right_status = eval_condition(self.ctx, condition.right)
 
             if left_status == Status.FALSE and right_status == Status.FALSE:
                 lines.append(f"{prefix}OR fails because both sides are FALSE:")
-                left_str = format_condition(condition.left)
-                right_str = format_condition(condition.right)
+                left_str = self._format(condition.left)
+                right_str = self._format(condition.right)
                 lines.append(f"{prefix}  {left_str} is FALSE")
                 lines.append(f"{prefix}  {right_str} is FALSE")
 
         elif isinstance(condition, XorCondition):
-            left_status = eval_condition(self.ctx, condition.left, depth=0)
-            right_status = eval_condition(self.ctx, condition.right, depth=0)
+            left_status = eval_condition(self.ctx, condition.left)
+            right_status = eval_condition(self.ctx, condition.right)
 
             if left_status == right_status:
                 lines.append(f"{prefix}XOR fails (both sides are {left_status.name})")
@@ -541,11 +503,6 @@ class ReasoningVisualizer:
 
     def _explain_why_condition_true_detailed(self, condition: "Condition", indent: int = 0) -> List[str]:
         """Explain why a condition is true with proper indentation."""
-        from src.exec import FactCondition, AndCondition, OrCondition, XorCondition, NotCondition
-        from src.exec.eval_condition import eval_condition
-        from src.exec.status import Status
-        from src.exec.format_condition import format_condition
-
         prefix = " " * indent
         lines = []
 
@@ -559,14 +516,13 @@ class ReasoningVisualizer:
                     # Find the rule that proved it
                     rules_for_symbol = self.ctx.rules_by_conclusion.get(symbol, [])
                     for rule in rules_for_symbol:
-                        from src.exec import NotCondition as NC
-                        if isinstance(rule.conclusion, NC):
+                        if isinstance(rule.conclusion, NotCondition):
                             continue
 
-                        cond_status = eval_condition(self.ctx, rule.condition, depth=0)
+                        cond_status = eval_condition(self.ctx, rule.condition)
                         if cond_status == Status.TRUE:
-                            cond_str = format_condition(rule.condition)
-                            conclusion_str = format_condition(rule.conclusion)
+                            cond_str = self._format(rule.condition)
+                            conclusion_str = self._format(rule.conclusion)
                             lines.append(f"{prefix}{symbol} is TRUE (proven by rule '{cond_str} => {conclusion_str}'):")
                             inner_lines = self._explain_why_condition_true_detailed(rule.condition, indent + 2)
                             lines.extend(inner_lines)
@@ -575,8 +531,7 @@ class ReasoningVisualizer:
                     lines.append(f"{prefix}{symbol} is {status.name}")
 
         elif isinstance(condition, NotCondition):
-            from src.exec import FactCondition as FC
-            if isinstance(condition.condition, FC):
+            if isinstance(condition.condition, FactCondition):
                 symbol = condition.condition.symbol
                 status = self.ctx.get_status(symbol)
                 lines.append(f"{prefix}!{symbol} is TRUE because {symbol} is FALSE")
@@ -584,8 +539,8 @@ class ReasoningVisualizer:
                 lines.append(f"{prefix}Negation is TRUE")
 
         elif isinstance(condition, AndCondition):
-            left_str = format_condition(condition.left)
-            right_str = format_condition(condition.right)
+            left_str = self._format(condition.left)
+            right_str = self._format(condition.right)
             lines.append(f"{prefix}AND condition satisfied ({left_str} AND {right_str}):")
             left_lines = self._explain_why_condition_true_detailed(condition.left, indent + 2)
             lines.extend(left_lines)
@@ -593,112 +548,116 @@ class ReasoningVisualizer:
             lines.extend(right_lines)
 
         elif isinstance(condition, OrCondition):
-            left_status = eval_condition(self.ctx, condition.left, depth=0)
-            right_status = eval_condition(self.ctx, condition.right, depth=0)
+            left_status = eval_condition(self.ctx, condition.left)
+            right_status = eval_condition(self.ctx, condition.right)
 
             if left_status == Status.TRUE:
-                left_str = format_condition(condition.left)
+                left_str = self._format(condition.left)
                 lines.append(f"{prefix}OR satisfied because {left_str} is TRUE:")
                 left_lines = self._explain_why_condition_true_detailed(condition.left, indent + 2)
                 lines.extend(left_lines)
             elif right_status == Status.TRUE:
-                right_str = format_condition(condition.right)
+                right_str = self._format(condition.right)
                 lines.append(f"{prefix}OR satisfied because {right_str} is TRUE:")
                 right_lines = self._explain_why_condition_true_detailed(condition.right, indent + 2)
                 lines.extend(right_lines)
 
         elif isinstance(condition, XorCondition):
-            left_status = eval_condition(self.ctx, condition.left, depth=0)
-            right_status = eval_condition(self.ctx, condition.right, depth=0)
+            left_status = eval_condition(self.ctx, condition.left)
+            right_status = eval_condition(self.ctx, condition.right)
 
             if left_status == Status.TRUE and right_status == Status.FALSE:
-                left_str = format_condition(condition.left)
+                left_str = self._format(condition.left)
                 lines.append(f"{prefix}XOR satisfied (only {left_str} is TRUE)")
             elif left_status == Status.FALSE and right_status == Status.TRUE:
-                right_str = format_condition(condition.right)
+                right_str = self._format(condition.right)
                 lines.append(f"{prefix}XOR satisfied (only {right_str} is TRUE)")
 
         return lines if lines else [f"{prefix}Condition is true"]
 
     def _explain_condition(self, condition: "Condition") -> str:
-        """Recursively explain how a condition is satisfied."""
-        from src.exec import FactCondition, AndCondition, OrCondition, XorCondition, NotCondition
-        from src.exec.status import Status
-
+        """Explain how a condition is satisfied, walking the tree with an explicit stack."""
+        # A node's explanation is its own text, then each operand's explanation on a
+        # new indented line: emitting those pieces in preorder and joining them once
+        # builds the same text without copying nested explanations at every level
+        pieces: List[str] = []
+        stack: list = [condition]
+        while stack:
+            item = stack.pop()
+            if type(item) is str:
+                pieces.append(item)
+                continue
+            head, operands = self._explain_step(item)
+            pieces.append(head)
+            # Reversed, so the left operand is explained first
+            for operand in reversed(operands):
+                stack.append(operand)
+                stack.append("\n  ")
+        return "".join(pieces)
+
+    def _explain_step(self, condition: "Condition") -> Tuple[str, Tuple["Condition", ...]]:
+        """
+        One node of _explain_condition(): its text, and the operands whose
+        explanations follow it, each on its own indented line.
+        """
         if isinstance(condition, FactCondition):
             symbol = condition.symbol
             if self.ctx.is_fact_true(symbol):
-                return f"We know that {symbol} is true (given as fact)."
+                return f"We know that {symbol} is true (given as fact).", ()
             else:
                 status = self.ctx.get_status(symbol)
                 if status == Status.TRUE:
                     # Explain how this symbol was proven
                     explanation = self._explain_how_proven(symbol)
-                    return f"We know that {symbol} is true.\n  {explanation}"
+                    return f"We know that {symbol} is true.\n  {explanation}", ()
                 elif status == Status.FALSE:
                     # Explain how this symbol was disproven
                     explanation = self._explain_how_disproven(symbol)
-                    return f"We know that {symbol} is false.\n  {explanation}"
+                    return f"We know that {symbol} is false.\n  {explanation}", ()
                 else:
-                    return f"We know that {symbol} is false."
+                    return f"We know that {symbol} is false.", ()
 
         elif isinstance(condition, NotCondition):
             # For negation, we need to explain why the inner condition is false/true
-            from src.exec import FactCondition as FC
-            if isinstance(condition.condition, FC):
+            if isinstance(condition.condition, FactCondition):
                 symbol = condition.condition.symbol
                 status = self.ctx.get_status(symbol)
                 if status == Status.FALSE:
                     # Symbol is false, so !symbol is true
                     explanation = self._explain_how_disproven(symbol)
-                    return f"The negation !{symbol} is true because {symbol} is false.\n  {explanation}"
+                    return f"The negation !{symbol} is true because {symbol} is false.\n  {explanation}", ()
                 else:
-                    return f"The negation is satisfied because {symbol} is false."
+                    return f"The negation is satisfied because {symbol} is false.", ()
             else:
-                inner_explanation = self._explain_condition(condition.condition)
-                return f"The negation is satisfied:\n  {inner_explanation}"
+                return "The negation is satisfied:", (condition.condition,)
 
         elif isinstance(condition, AndCondition):
-            left_exp = self._explain_condition(condition.left)
-            right_exp = self._explain_condition(condition.right)
-            from src.exec.format_condition import format_condition
-            return f"Both conditions of '{format_condition(condition)}' are satisfied:\n  {left_exp}\n  {right_exp}"
+            return f"Both conditions of '{self._format(condition)}' are satisfied:", (condition.left, condition.right)
 
         elif isinstance(condition, OrCondition):
             # Check which branch is true
-            from src.exec.eval_condition import eval_condition
-            left_status = eval_condition(self.ctx, condition.left, depth=0)
-            right_status = eval_condition(self.ctx, condition.right, depth=0)
-
-            from src.exec.format_condition import format_condition
+            left_status = eval_condition(self.ctx, condition.left)
+            right_status = eval_condition(self.ctx, condition.right)
 
             if left_status == Status.TRUE and right_status == Status.TRUE:
-                left_exp = self._explain_condition(condition.left)
-                right_exp = self._explain_condition(condition.right)
-                return f"Both conditions of '{format_condition(condition)}' are true:\n  {left_exp}\n  {right_exp}"
+                return f"Both conditions of '{self._format(condition)}' are true:", (condition.left, condition.right)
             elif left_status == Status.TRUE:
-                left_exp = self._explain_condition(condition.left)
-                return f"At least one condition of '{format_condition(condition)}' is satisfied:\n  {left_exp}"
+                return f"At least one condition of '{self._format(condition)}' is satisfied:", (condition.left,)
             else:
-                right_exp = self._explain_condition(condition.right)
-                return f"At least one condition of '{format_condition(condition)}' is satisfied:\n  {right_exp}"
+                return f"At least one condition of '{self._format(condition)}' is satisfied:", (condition.right,)
 
         elif isinstance(condition, XorCondition):
-            from src.exec.eval_condition import eval_condition
-            from src.exec.format_condition import format_condition
-            left_status = eval_condition(self.ctx, condition.left, depth=0)
-            right_status = eval_condition(self.ctx, condition.right, depth=0)
+            left_status = eval_condition(self.ctx, condition.left)
+            right_status = eval_condition(self.ctx, condition.right)
 
             if left_status == Status.TRUE and right_status == Status.FALSE:
-                left_exp = self._explain_condition(condition.left)
-                return f"Exactly one condition of '{format_condition(condition)}' is true:\n  {left_exp}"
+                return f"Exactly one condition of '{self._format(condition)}' is true:", (condition.left,)
             elif left_status == Status.FALSE and right_status == Status.TRUE:
-                right_exp = self._explain_condition(condition.right)
-                return f"Exactly one condition of '{format_condition(condition)}' is true:\n  {right_exp}"
+                return f"Exactly one condition of '{self._format(condition)}' is true:", (condition.right,)
             else:
-                return f"The XOR condition '{format_condition(condition)}' is satisfied."
+                return f"The XOR condition '{self._format(condition)}' is satisfied.", ()
 
-        return "Condition is satisfied."
+        return "Condition is satisfied.", ()
 
 
 def visualize_reasoning(ctx: "ExecContext", program: "Program", results: Dict[str, "Status"]) -> None:
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import argparse
 import logging
+import re
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Set
 
 from src.parsing import LexerError, ParserError, ValidationError, parse_program
 from src.utils.program_logging import log_program, Colors
@@ -11,6 +13,15 @@ from src.exec import solve
 from src.exec.exec_context import ExecContext
 from src.exec.status import Status
 
+import src.exec as exec_module
+
+AndCondition = exec_module.AndCondition
+OrCondition = exec_module.OrCondition
+XorCondition = exec_module.XorCondition
+NotCondition = exec_module.NotCondition
+
+_BINARY_CONDITIONS = (AndCondition, OrCondition, XorCondition)
+
 
 class _ColorFormatter(logging.Formatter):
     COLORS = {
@@ -30,10 +41,77 @@ class _ColorFormatter(logging.Formatter):
         return f"{color}{base}{self.RESET}"
 
 
-_handler = logging.StreamHandler()
-_handler.setFormatter(_ColorFormatter("[%(levelname)s] %(message)s"))
+# SGR escape sequences, as found in the Colors codes
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*m")
+
+
+class _PlainFormatter(logging.Formatter):
+    """Formatter for a log stream that is not a terminal: colored messages are written without their escapes."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        if not record.getMessage():
+            return ""
+        return _ANSI_ESCAPE.sub("", super().format(record))
+
+
+class _BatchingStreamHandler(logging.StreamHandler):
+    """StreamHandler that can hold formatted records back and write them in one go."""
+
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        self._held: Optional[List[str]] = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._held is None:
+            super().emit(record)
+            return
+        try:
+            self._held.append(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Write every record emitted inside the block with a single write() at its end."""
+        self._held = []
+        try:
+            yield
+        finally:
+            held, self._held = self._held, None
+            if held:
+                self.acquire()
+                try:
+                    self.stream.write("".join(held))
+                    self.flush()
+                finally:
+                    self.release()
+
+
+_handler = _BatchingStreamHandler()
+# Colors follow stdout, but records go to stderr, which may be redirected on its own
+if Colors.RESET and not _handler.stream.isatty():
+    _handler.setFormatter(_PlainFormatter("[%(levelname)s] %(message)s"))
+else:
+    _handler.setFormatter(_ColorFormatter("[%(levelname)s] %(message)s"))
 logging.basicConfig(level=logging.INFO, handlers=[_handler])
 
+# Colored output pieces, built once: only the variable parts are formatted per line
+_CONTRADICTION_RULE = f"{Colors.RED}{'=' * 60}{Colors.RESET}"
+_CONTRADICTION_HEADER = f"{Colors.RED}CONTRADICTIONS DETECTED{Colors.RESET}"
+_CONTRADICTION_LINE = f"{Colors.YELLOW}%s{Colors.RESET}"
+_EXECUTION_RESULTS_HEADER = f"{Colors.MAGENTA}Execution results{Colors.RESET}"
+_STATUS_LABELS = {
+    Status.TRUE: f"{Colors.GREEN}TRUE{Colors.RESET}",
+    Status.FALSE: f"{Colors.RED}FALSE{Colors.RESET}",
+    Status.UNDETERMINED: f"{Colors.YELLOW}UNDETERMINED{Colors.RESET}",
+}
+_OPERATORS_HEADER = f"{Colors.MAGENTA}Operators used in rules{Colors.RESET}"
+_OPERATOR_LINE = f"{Colors.CYAN}%s{Colors.RESET}: %s"
+_BOOL_LABELS = {
+    True: f"{Colors.GREEN}True{Colors.RESET}",
+    False: f"{Colors.RED}False{Colors.RESET}",
+}
+
 
 def _run(argv: Optional[List[str]] = None) -> int:
     parser = argparse.ArgumentParser(description="Run the expert system.")
@@ -56,7 +134,9 @@ def _run(argv: Optional[List[str]] = None) -> int:
         logging.error("Failed to parse '%s': %s", config_path, error)
         return 1
 
-    log_program(program)
+    # The summary is one record per line: write it out with one syscall instead of one per line
+    with _handler.batch():
+        log_program(program)
 
     # Interactive mode loop
     if args.interactive:
@@ -85,15 +165,12 @@ def _display_results(ctx: ExecContext, results, program, config_data: str, reaso
     # Display contradictions if any were detected
     if hasattr(ctx, 'contradictions') and ctx.contradictions:
         print("")
-        error_color = Colors.RED
-        warning_color = Colors.YELLOW
-        reset = Colors.RESET
-        print(f"{error_color}{'=' * 60}{reset}")
-        print(f"{error_color}CONTRADICTIONS DETECTED{reset}")
-        print(f"{error_color}{'=' * 60}{reset}")
+        print(_CONTRADICTION_RULE)
+        print(_CONTRADICTION_HEADER)
+        print(_CONTRADICTION_RULE)
         for contradiction in ctx.contradictions:
-            print(f"{warning_color}{contradiction}{reset}")
-        print(f"{error_color}{'=' * 60}{reset}")
+            print(_CONTRADICTION_LINE % contradiction)
+        print(_CONTRADICTION_RULE)
         print("")
         logging.error("Cannot provide reliable results due to contradictions in the rule base.")
         return 1
@@ -106,85 +183,47 @@ def _display_results(ctx: ExecContext, results, program, config_data: str, reaso
 
     # Log actual evaluation results from exec
     logging.info("")
-    header_color = "\033[95m"
-    reset = "\033[0m"
-    logging.info("%sExecution results%s", header_color, reset)
-
-    true_color = "\033[92m"
-    false_color = "\033[91m"
-    undetermined_color = "\033[93m"  # Yellow for undetermined
-
-    def _colorize(status: Status) -> str:
-        if status is Status.TRUE:
-            return f"{true_color}TRUE{reset}"
-        elif status is Status.FALSE:
-            return f"{false_color}FALSE{reset}"
-        elif status is Status.UNDETERMINED:
-            return f"{undetermined_color}UNDETERMINED{reset}"
-        else:
-            return f"{status.name}"
+    logging.info(_EXECUTION_RESULTS_HEADER)
 
     for label, status in results.items():
-        logging.info("%s: %s", label, _colorize(status))
+        logging.info("%s: %s", label, _STATUS_LABELS.get(status) or status.name)
 
     _log_evaluation_results(program, config_data)
 
 
+def _operator_types(program) -> Set[type]:
+    """Collect the node types appearing in any rule condition or conclusion, in a single walk."""
+    used: Set[type] = set()
+    stack = []
+    for rule in program.rules:
+        stack.append(rule.condition)
+        stack.append(rule.conclusion)
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        used.add(node_type)
+        if node_type is NotCondition:
+            stack.append(node.condition)
+        elif node_type in _BINARY_CONDITIONS:
+            stack.append(node.left)
+            stack.append(node.right)
+    return used
+
+
 def _log_evaluation_results(program, config_data: str = "") -> None:
     """Display which operators are used in the rule file."""
-    import src.exec as exec_module
-
     logging.info("")
-    header_color = Colors.MAGENTA
-    label_color = Colors.CYAN
-    true_color = Colors.GREEN
-    false_color = Colors.RED
-    reset = Colors.RESET
-
-    logging.info("%sOperators used in rules%s", header_color, reset)
-
-    def _colorize(value: bool) -> str:
-        return f"{true_color}{value}{reset}" if value else f"{false_color}{value}{reset}"
+    logging.info(_OPERATORS_HEADER)
 
     def _log(label: str, value: bool) -> None:
-        logging.info("%s%s%s: %s", label_color, label, reset, _colorize(value))
+        logging.info(_OPERATOR_LINE, label, _BOOL_LABELS[value])
 
     # Check if operators are actually used in the rules
-    def has_operator_in_condition(cond, operator_type) -> bool:
-        """Recursively check if a condition contains a specific operator."""
-        if isinstance(cond, operator_type):
-            return True
-        if isinstance(cond, (exec_module.AndCondition, exec_module.OrCondition, exec_module.XorCondition)):
-            return has_operator_in_condition(cond.left, operator_type) or has_operator_in_condition(cond.right, operator_type)
-        if isinstance(cond, exec_module.NotCondition):
-            return has_operator_in_condition(cond.condition, operator_type)
-        return False
-
-    has_and = False
-    has_or = False
-    has_xor = False
-    has_not = False
-
-    for rule in program.rules:
-        # Check condition
-        if has_operator_in_condition(rule.condition, exec_module.AndCondition):
-            has_and = True
-        if has_operator_in_condition(rule.condition, exec_module.OrCondition):
-            has_or = True
-        if has_operator_in_condition(rule.condition, exec_module.XorCondition):
-            has_xor = True
-        if has_operator_in_condition(rule.condition, exec_module.NotCondition):
-            has_not = True
-
-        # Check conclusion
-        if has_operator_in_condition(rule.conclusion, exec_module.AndCondition):
-            has_and = True
-        if has_operator_in_condition(rule.conclusion, exec_module.OrCondition):
-            has_or = True
-        if has_operator_in_condition(rule.conclusion, exec_module.XorCondition):
-            has_xor = True
-        if has_operator_in_condition(rule.conclusion, exec_module.NotCondition):
-            has_not = True
+    used = _operator_types(program)
+    has_and = AndCondition in used
+    has_or = OrCondition in used
+    has_xor = XorCondition in used
+    has_not = NotCondition in used
 
     _log("AND", has_and)
     _log("OR", has_or)
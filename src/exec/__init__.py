@@ -1,27 +1,37 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Sequence, Set
+from typing import ClassVar, List, Sequence, Set
 
 class Condition:
     """Base class that stores the textual representation of a condition."""
 
+    # Conditions are built for every rule node: no per-instance __dict__ anywhere in the hierarchy
+    __slots__ = ()
+
     rule_format: str | None = None
 
     def __str__(self) -> str:
         return self.rule_format or self.__class__.__name__
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class FactCondition(Condition):
-    """Represents a single fact such as 'A'."""
+    """
+    Represents a single fact such as 'A'.
+
+    Frozen: the parser hands out one shared node per symbol to every
+    program it parses, so a change to one would show up in all of them.
+    """
 
     symbol: str
     rule_format: str | None = field(default=None, init=False)
 
     def __post_init__(self) -> None:
-        self.symbol = self.symbol.strip().upper()
-        self.rule_format = self.symbol
+        symbol = sys.intern(self.symbol.strip().upper())
+        object.__setattr__(self, "symbol", symbol)
+        object.__setattr__(self, "rule_format", symbol)
 
 
 @dataclass(slots=True)
@@ -42,26 +52,28 @@ class BinaryCondition(Condition):
 
     left: Condition
     right: Condition
-    operator: str = field(init=False, default="?")
+    operator: ClassVar[str] = "?"
     rule_format: str | None = field(default=None, init=False)
 
     def __post_init__(self) -> None:
         left_label = getattr(self.left, "rule_format", str(self.left))
         right_label = getattr(self.right, "rule_format", str(self.right))
-        operator_symbol = getattr(type(self), "operator", self.operator)
-        self.operator = operator_symbol
+        operator_symbol = type(self).operator
         self.rule_format = f"({left_label} {operator_symbol} {right_label})"
 
 
 class AndCondition(BinaryCondition):
+    __slots__ = ()
     operator = "+"
 
 
 class OrCondition(BinaryCondition):
+    __slots__ = ()
     operator = "|"
 
 
 class XorCondition(BinaryCondition):
+    __slots__ = ()
     operator = "^"
 
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Generator, List, Tuple, Union
 
 import src.exec as exec_module
 
@@ -11,18 +11,63 @@ AndCondition = exec_module.AndCondition
 OrCondition = exec_module.OrCondition
 XorCondition = exec_module.XorCondition
 
-from .status import Status
+from .status import FALSE, TRUE, UNDETERMINED, UNKNOWN, Status
 
 if TYPE_CHECKING:
     from .exec_context import ExecContext
 
 
-def eval_condition(ctx: "ExecContext", cond: Condition, depth: int = 0) -> Status:
+# Opcodes of a compiled condition: a non-negative entry is the id of a symbol to push,
+# a negative one combines the values on top of the stack
+OP_NOT = -1
+OP_AND = -2
+OP_OR = -3
+OP_XOR = -4
+
+_BINARY_OPS = {
+    AndCondition: OP_AND,
+    OrCondition: OP_OR,
+    XorCondition: OP_XOR,
+}
+
+
+def compile_condition(cond: Condition, intern: Callable[[str], int]) -> Tuple[int, ...]:
+    """
+    Flatten a Condition tree into a postorder tuple of opcodes.
+
+    Leaves are emitted left to right as symbol ids and each operator follows
+    its operands, so evaluating the tuple with a value stack visits symbols
+    in the same order as walking the tree would.
+    """
+    ops: List[int] = []
+    work: List[Union[Condition, int]] = [cond]
+    while work:
+        node = work.pop()
+        node_type = type(node)
+        if node_type is int:
+            ops.append(node)
+        elif node_type is FactCondition:
+            ops.append(intern(node.symbol))
+        elif node_type is NotCondition:
+            work.append(OP_NOT)
+            work.append(node.condition)
+        elif node_type in _BINARY_OPS:
+            # Right pushed first so the left operand is emitted first
+            work.append(_BINARY_OPS[node_type])
+            work.append(node.right)
+            work.append(node.left)
+        else:
+            # If you ever add new Condition subclasses and forget to handle them here
+            raise TypeError(f"Unsupported condition type in eval_condition: {node_type.__name__}")
+    return tuple(ops)
+
+
+def eval_condition(ctx: "ExecContext", cond: Condition) -> Status:
     """
     Evaluate a Condition tree to a Status value using three-valued logic.
 
     - For FactCondition, ask the solver for the symbol's truth value.
-    - For NOT / AND / OR / XOR, recurse on children with three-valued logic:
+    - For NOT / AND / OR / XOR, evaluate the children with three-valued logic:
       - TRUE, FALSE, UNDETERMINED
 
     Three-valued logic rules:
@@ -34,69 +79,83 @@ def eval_condition(ctx: "ExecContext", cond: Condition, depth: int = 0) -> Statu
     Args:
         ctx: Execution context
         cond: Condition to evaluate
-        depth: Recursion depth for indentation
     """
-    # Local import to avoid circular dependency: solve_symbol() also uses eval_condition()
-    from .solve import solve_symbol
-
-    # SYMBOL / atomic fact: delegate to the solver
-    if isinstance(cond, FactCondition):
-        return solve_symbol(ctx, cond.symbol, depth)
-
-    # NOT
-    if isinstance(cond, NotCondition):
-        status = eval_condition(ctx, cond.condition, depth)
-        if status is Status.TRUE:
-            return Status.FALSE
-        elif status is Status.FALSE:
-            return Status.TRUE
-        else:  # UNDETERMINED
-            return Status.UNDETERMINED
-
-    # AND
-    if isinstance(cond, AndCondition):
-        left = eval_condition(ctx, cond.left, depth)
-        right = eval_condition(ctx, cond.right, depth)
-
-        # FALSE if either is FALSE
-        if left is Status.FALSE or right is Status.FALSE:
-            return Status.FALSE
-        # TRUE only if both are TRUE
-        elif left is Status.TRUE and right is Status.TRUE:
-            return Status.TRUE
-        # Otherwise UNDETERMINED
-        else:
-            return Status.UNDETERMINED
-
-    # OR
-    if isinstance(cond, OrCondition):
-        left = eval_condition(ctx, cond.left, depth)
-        right = eval_condition(ctx, cond.right, depth)
-
-        # TRUE if either is TRUE
-        if left is Status.TRUE or right is Status.TRUE:
-            return Status.TRUE
-        # FALSE only if both are FALSE
-        elif left is Status.FALSE and right is Status.FALSE:
-            return Status.FALSE
-        # Otherwise UNDETERMINED
-        else:
-            return Status.UNDETERMINED
-
-    # XOR
-    if isinstance(cond, XorCondition):
-        left = eval_condition(ctx, cond.left, depth)
-        right = eval_condition(ctx, cond.right, depth)
-
-        # If either is UNDETERMINED, result is UNDETERMINED
-        if left is Status.UNDETERMINED or right is Status.UNDETERMINED:
-            return Status.UNDETERMINED
-        # TRUE if exactly one is TRUE
-        elif (left is Status.TRUE and right is Status.FALSE) or (left is Status.FALSE and right is Status.TRUE):
-            return Status.TRUE
-        # FALSE if both are same (both TRUE or both FALSE)
-        else:
-            return Status.FALSE
+    return _solve.run_steps(ctx, eval_steps(ctx, ctx.compile(cond)))
 
-    # If you ever add new Condition subclasses and forget to handle them here
-    raise TypeError(f"Unsupported condition type in eval_condition: {type(cond).__name__}")
+
+def eval_steps(ctx: "ExecContext", ops: Tuple[int, ...]) -> Generator[int, Status, Status]:
+    """
+    Evaluate a compiled condition (see compile_condition), as a generator driven by solve.run_steps().
+
+    The opcodes are scanned once with a value stack. Symbols whose status is
+    already known (memoised, being proved or an initial fact) are read directly;
+    for the others the generator yields the symbol id and is resumed with its
+    solved status.
+    """
+    status_table = ctx.status
+    fact_status = ctx.fact_status
+    in_progress = ctx.in_progress
+    values: List[Status] = []
+    push = values.append
+    pop = values.pop
+
+    for op in ops:
+        # SYMBOL / atomic fact: delegate to the solver
+        if op >= 0:
+            status = status_table[op]
+            if status is UNKNOWN:
+                if in_progress[op]:
+                    # Cycle back to a symbol being proved: undetermined
+                    status = UNDETERMINED
+                else:
+                    status = fact_status[op]
+                    if status is UNKNOWN:
+                        status = yield op
+                    else:
+                        status_table[op] = status
+            push(status)
+
+        # NOT
+        elif op == OP_NOT:
+            status = pop()
+            if status is TRUE:
+                push(FALSE)
+            elif status is FALSE:
+                push(TRUE)
+            else:  # UNDETERMINED
+                push(UNDETERMINED)
+
+        else:
+            right = pop()
+            left = pop()
+            if op == OP_AND:
+                # FALSE if either is FALSE, TRUE only if both are TRUE
+                if left is FALSE or right is FALSE:
+                    push(FALSE)
+                elif left is TRUE and right is TRUE:
+                    push(TRUE)
+                else:
+                    push(UNDETERMINED)
+            elif op == OP_OR:
+                # TRUE if either is TRUE, FALSE only if both are FALSE
+                if left is TRUE or right is TRUE:
+                    push(TRUE)
+                elif left is FALSE and right is FALSE:
+                    push(FALSE)
+                else:
+                    push(UNDETERMINED)
+            else:
+                # UNDETERMINED if either is, TRUE if exactly one is TRUE, else FALSE
+                if left is UNDETERMINED or right is UNDETERMINED:
+                    push(UNDETERMINED)
+                elif left is not right:
+                    push(TRUE)
+                else:
+                    push(FALSE)
+
+    return values[0]
+
+
+# Bound once at load time, after eval_steps exists: solve.py imports this module
+# and its generators also use eval_steps(), so the import has to come last.
+from . import solve as _solve  # noqa: E402
@@ -1,10 +1,116 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Set
+from typing import Callable, Dict, List, Set, Tuple
 
+from .eval_condition import compile_condition
+from .format_condition import format_condition
 from .status import Status
 
 from src.parsing.parser import Program, Rule
-from src.exec import Condition
+from src.exec import AndCondition, Condition, FactCondition, NotCondition, OrCondition, XorCondition
+
+_BINARY_CONDITIONS = (AndCondition, OrCondition, XorCondition)
+
+
+def _extract_fact_symbols(cond: Condition) -> Set[str]:
+    """Collect all FactCondition symbols from a Condition tree into a single set."""
+    symbols: Set[str] = set()
+    stack = [cond]
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type is FactCondition:
+            symbols.add(node.symbol)
+        elif node_type is NotCondition:
+            stack.append(node.condition)
+        elif node_type in _BINARY_CONDITIONS:
+            stack.append(node.right)
+            stack.append(node.left)
+    return symbols
+
+
+def _asserted_literals(conclusion: Condition) -> List[Tuple[str, bool]]:
+    """
+    List the (symbol, value) pairs a conclusion asserts when its rule fires, left to right.
+
+    Facts assert TRUE, every symbol under a NOT asserts FALSE and AND asserts both
+    sides. OR/XOR branches are ambiguous and assert nothing.
+    """
+    literals: List[Tuple[str, bool]] = []
+    stack = [conclusion]
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type is FactCondition:
+            literals.append((node.symbol, True))
+        elif node_type is NotCondition:
+            literals.extend((sym, False) for sym in _extract_fact_symbols(node.condition))
+        elif node_type is AndCondition:
+            stack.append(node.right)
+            stack.append(node.left)
+    return literals
+
+
+@dataclass(slots=True)
+class RuleMeta:
+    """
+    Per-rule data derived once when the context is built.
+
+    Rule trees never change while solving, so the compiled condition, the
+    conclusion node type, the conclusion symbols and the literals the
+    conclusion asserts are computed a single time instead of on every rule
+    visit. The display strings are only needed to report a contradiction,
+    so they are formatted on demand.
+    """
+    rule: "Rule"
+    condition_ops: Tuple[int, ...]
+    condition_symbol: int
+    conclusion_kind: type
+    conclusion_symbols: Set[str]
+    conclusion_ids: Tuple[int, ...]
+    # Bit `sid` set for each conclusion symbol
+    conclusion_mask: int
+    asserted_literals: Tuple[Tuple[int, bool], ...]
+    # Bit `sid` set for each symbol the conclusion asserts TRUE / FALSE
+    asserted_true_mask: int
+    asserted_false_mask: int
+
+    @classmethod
+    def from_rule(cls, rule: "Rule", intern: Callable[[str], int]) -> "RuleMeta":
+        conclusion_symbols = _extract_fact_symbols(rule.conclusion)
+        condition_ops = compile_condition(rule.condition, intern)
+        conclusion_ids = tuple(intern(sym) for sym in conclusion_symbols)
+        asserted_literals = tuple((intern(sym), value) for sym, value in _asserted_literals(rule.conclusion))
+        conclusion_mask = 0
+        for sid in conclusion_ids:
+            conclusion_mask |= 1 << sid
+        true_mask = 0
+        false_mask = 0
+        for sid, value in asserted_literals:
+            if value:
+                true_mask |= 1 << sid
+            else:
+                false_mask |= 1 << sid
+        return cls(
+            rule=rule,
+            condition_ops=condition_ops,
+            # Id of the symbol when the whole condition is a single one, else -1
+            condition_symbol=condition_ops[0] if len(condition_ops) == 1 else -1,
+            conclusion_kind=type(rule.conclusion),
+            conclusion_symbols=conclusion_symbols,
+            conclusion_ids=conclusion_ids,
+            conclusion_mask=conclusion_mask,
+            asserted_literals=asserted_literals,
+            asserted_true_mask=true_mask,
+            asserted_false_mask=false_mask,
+        )
+
+    @property
+    def condition_str(self) -> str:
+        return format_condition(self.rule.condition)
+
+    @property
+    def conclusion_str(self) -> str:
+        return format_condition(self.rule.conclusion)
 
 
 @dataclass
@@ -15,15 +121,33 @@ class ExecContext:
     It wraps the parsed Program and adds:
     - facts as a set (for O(1) lookup)
     - rules_by_conclusion: index rules by conclusion symbol
-    - status: memoisation + cycle detection for each symbol
+    - rule_meta: the same rules with precomputed RuleMeta
+    - compiled_conditions: compiled opcodes of every condition evaluated so far
+    - symbol_ids / symbols: every symbol interned to a dense integer id
+
+    The solver works on ids, so its tables are plain sequences indexed by id:
+    - meta_by_conclusion: RuleMeta of the rules concluding each symbol
+    - fact_status: initial facts as TRUE/FALSE (UNKNOWN when not a fact)
+    - fact_true_mask / fact_false_mask: the same facts as bitmasks over ids
+    - status: memoised result of each symbol (UNKNOWN until solved)
+    - in_progress: 1 for each symbol currently being proved (cycle detection)
     - contradictions: list of detected contradictions
     """
     program: "Program"
 
     facts_true: Set[str] = field(default_factory=set)
     facts_false: Set[str] = field(default_factory=set)
-    rules_by_conclusion: Dict[str, List["Rule"]] = field(default_factory=dict)
-    status: Dict[str, Status] = field(default_factory=dict)
+    rules_by_conclusion: Dict[str, Tuple["Rule", ...]] = field(default_factory=dict)
+    rule_meta: List[RuleMeta] = field(default_factory=list)
+    compiled_conditions: Dict[int, Tuple[Condition, Tuple[int, ...]]] = field(default_factory=dict)
+    symbol_ids: Dict[str, int] = field(default_factory=dict)
+    symbols: List[str] = field(default_factory=list)
+    meta_by_conclusion: List[Tuple[RuleMeta, ...]] = field(default_factory=list)
+    fact_status: List[Status] = field(default_factory=list)
+    fact_true_mask: int = 0
+    fact_false_mask: int = 0
+    status: List[Status] = field(default_factory=list)
+    in_progress: bytearray = field(default_factory=bytearray)
     contradictions: List[str] = field(default_factory=list)
 
     # -------------- CONSTRUCTOR FROM PROGRAM --------------
@@ -36,6 +160,7 @@ class ExecContext:
         This is the 'setup' phase before we start solving:
         - store the program
         - copy facts into a set
+        - intern every symbol of the facts, queries and rules
         - build the rules_by_conclusion index
         - initialise each symbol's status to UNKNOWN
         """
@@ -45,49 +170,73 @@ class ExecContext:
         ctx.facts_true = {symbol for symbol, value in program.facts.items() if value}
         ctx.facts_false = {symbol for symbol, value in program.facts.items() if not value}
 
-        ctx.rules_by_conclusion = {}
-
-        # Helper to extract all fact symbols from a conclusion condition tree
-        def extract_conclusion_symbols(cond: "Condition") -> Set[str]:
-            """Recursively extract all FactCondition symbols from a Condition tree."""
-            import src.exec as exec_module
-            if isinstance(cond, exec_module.FactCondition):
-                return {cond.symbol}
-            elif isinstance(cond, (exec_module.AndCondition, exec_module.OrCondition, exec_module.XorCondition)):
-                return extract_conclusion_symbols(cond.left) | extract_conclusion_symbols(cond.right)
-            elif isinstance(cond, exec_module.NotCondition):
-                return extract_conclusion_symbols(cond.condition)
-            return set()
+        intern = ctx.intern
+        for symbol in program.facts:
+            intern(symbol)
+        for query in program.queries:
+            intern(query)
 
+        rules_by_symbol: Dict[str, List["Rule"]] = {}
+        meta_by_sid: Dict[int, List[RuleMeta]] = {}
         for rule in program.rules:
+            meta = RuleMeta.from_rule(rule, intern)
+            ctx.rule_meta.append(meta)
+            ctx.compiled_conditions[id(rule.condition)] = (rule.condition, meta.condition_ops)
+
             # Conclusions can now be complex (OrCondition, XorCondition, etc.)
             # Index by all symbols that appear in the conclusion
-            conclusion_symbols = extract_conclusion_symbols(rule.conclusion)
-            for sym in conclusion_symbols:
-                ctx.rules_by_conclusion.setdefault(sym, []).append(rule)
-
-        symbols: Set[str] = set()
-
-        # Add all fact symbols (both true and false)
-        symbols |= set(program.facts.keys())
+            for sym, sid in zip(meta.conclusion_symbols, meta.conclusion_ids):
+                rules_by_symbol.setdefault(sym, []).append(rule)
+                meta_by_sid.setdefault(sid, []).append(meta)
 
-        # Add query symbols
-        for query in program.queries:
-            symbols.add(query)
+        # The indexes never change once built: freeze them into tuples
+        ctx.rules_by_conclusion = {sym: tuple(rules) for sym, rules in rules_by_symbol.items()}
+        for sid, metas in meta_by_sid.items():
+            ctx.meta_by_conclusion[sid] = tuple(metas)
 
-        # Add conclusion symbols from rules
-        for rule in program.rules:
-            symbols |= extract_conclusion_symbols(rule.conclusion)
+        return ctx
 
-        ctx.status = {sym: Status.UNKNOWN for sym in symbols}
+    def intern(self, symbol: str) -> int:
+        """Return the id of `symbol`, growing the per-symbol tables on first sight."""
+        sid = self.symbol_ids.get(symbol)
+        if sid is None:
+            sid = len(self.symbols)
+            self.symbol_ids[symbol] = sid
+            self.symbols.append(symbol)
+            self.meta_by_conclusion.append(())
+            if symbol in self.facts_true:
+                self.fact_status.append(Status.TRUE)
+                self.fact_true_mask |= 1 << sid
+            elif symbol in self.facts_false:
+                self.fact_status.append(Status.FALSE)
+                self.fact_false_mask |= 1 << sid
+            else:
+                self.fact_status.append(Status.UNKNOWN)
+            self.status.append(Status.UNKNOWN)
+            self.in_progress.append(0)
+        return sid
+
+    def compile(self, cond: Condition) -> Tuple[int, ...]:
+        """
+        Return the compiled opcodes of `cond`, compiling it on first use.
 
-        return ctx
+        Entries are keyed by id() and keep their node alive, so an id cannot
+        be reused by another condition while it is cached.
+        """
+        entry = self.compiled_conditions.get(id(cond))
+        if entry is None:
+            entry = (cond, compile_condition(cond, self.intern))
+            self.compiled_conditions[id(cond)] = entry
+        return entry[1]
 
     def get_status(self, symbol: str) -> Status:
-        return self.status.get(symbol, Status.UNKNOWN)
+        sid = self.symbol_ids.get(symbol)
+        if sid is None:
+            return Status.UNKNOWN
+        return self.status[sid]
 
     def set_status(self, symbol: str, new_status: Status) -> None:
-        self.status[symbol] = new_status
+        self.status[self.intern(symbol)] = new_status
 
     def is_fact_true(self, symbol: str) -> bool:
         return symbol in self.facts_true
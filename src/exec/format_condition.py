@@ -1,40 +1,78 @@
 """Helper to format Condition objects as readable strings."""
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import Callable, Dict, List, Tuple, Union
 
-if TYPE_CHECKING:
-    import src.exec as exec_module
+import src.exec as exec_module
 
+Condition = exec_module.Condition
+FactCondition = exec_module.FactCondition
+NotCondition = exec_module.NotCondition
+AndCondition = exec_module.AndCondition
+OrCondition = exec_module.OrCondition
+XorCondition = exec_module.XorCondition
 
-def format_condition(cond: "exec_module.Condition") -> str:
+# Binding strength of each node type: a child that binds looser than its parent gets parentheses
+_PRECEDENCE: Dict[type, int] = {
+    OrCondition: 1,
+    XorCondition: 1,
+    AndCondition: 2,
+    NotCondition: 3,
+    FactCondition: 4,
+}
+
+
+# Work items are either literal text or a (node, parent_precedence) pair still to expand
+_WorkItem = Union[str, Tuple[Condition, int]]
+
+
+def _expand_fact(cond: FactCondition, stack: List[_WorkItem]) -> None:
+    stack.append(cond.symbol)
+
+
+def _expand_not(cond: NotCondition, stack: List[_WorkItem]) -> None:
+    stack.append((cond.condition, _PRECEDENCE[NotCondition]))
+    stack.append("!")
+
+
+def _expand_binary(cond: exec_module.BinaryCondition, stack: List[_WorkItem]) -> None:
+    precedence = _PRECEDENCE[type(cond)]
+    stack.append((cond.right, precedence))
+    stack.append(f" {cond.operator} ")
+    stack.append((cond.left, precedence))
+
+
+# Each expander pushes its pieces in reverse so they pop off the stack left to right
+_EXPANDERS: Dict[type, Callable[[Condition, List[_WorkItem]], None]] = {
+    FactCondition: _expand_fact,
+    NotCondition: _expand_not,
+    AndCondition: _expand_binary,
+    OrCondition: _expand_binary,
+    XorCondition: _expand_binary,
+}
+
+
+def format_condition(cond: Condition) -> str:
     """Convert a Condition tree to a human-readable string."""
-    import src.exec as exec_module
-
-    if isinstance(cond, exec_module.FactCondition):
-        return cond.symbol
-    elif isinstance(cond, exec_module.NotCondition):
-        inner = format_condition(cond.condition)
-        # Add parentheses if inner is complex
-        if isinstance(cond.condition, (exec_module.AndCondition, exec_module.OrCondition, exec_module.XorCondition)):
-            return f"!({inner})"
-        return f"!{inner}"
-    elif isinstance(cond, exec_module.AndCondition):
-        left = format_condition(cond.left)
-        right = format_condition(cond.right)
-        # Add parentheses for nested OR/XOR to show precedence
-        if isinstance(cond.left, (exec_module.OrCondition, exec_module.XorCondition)):
-            left = f"({left})"
-        if isinstance(cond.right, (exec_module.OrCondition, exec_module.XorCondition)):
-            right = f"({right})"
-        return f"{left} + {right}"
-    elif isinstance(cond, exec_module.OrCondition):
-        left = format_condition(cond.left)
-        right = format_condition(cond.right)
-        return f"{left} | {right}"
-    elif isinstance(cond, exec_module.XorCondition):
-        left = format_condition(cond.left)
-        right = format_condition(cond.right)
-        return f"{left} ^ {right}"
-    else:
-        return str(cond)
+    parts: List[str] = []
+    stack: List[_WorkItem] = [(cond, 0)]
+    while stack:
+        item = stack.pop()
+        if type(item) is str:
+            parts.append(item)
+            continue
+
+        node, parent_precedence = item
+        expander = _EXPANDERS.get(type(node))
+        if expander is None:
+            stack.append(str(node))
+            continue
+
+        if _PRECEDENCE[type(node)] < parent_precedence:
+            stack.append(")")
+            expander(node, stack)
+            stack.append("(")
+        else:
+            expander(node, stack)
+
+    return "".join(parts)
@@ -1,29 +1,30 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, Set
+from typing import TYPE_CHECKING, Dict, Generator
 
-from .status import Status
-from .eval_condition import eval_condition
-from .format_condition import format_condition
+import src.exec as exec_module
+
+FactCondition = exec_module.FactCondition
+NotCondition = exec_module.NotCondition
+AndCondition = exec_module.AndCondition
+OrCondition = exec_module.OrCondition
+XorCondition = exec_module.XorCondition
+
+from .status import FALSE, TRUE, UNDETERMINED, UNKNOWN, Status
+from .eval_condition import eval_steps
 
 if TYPE_CHECKING:
     from .exec_context import ExecContext
-    import src.exec as exec_module
 
+# Contradiction messages, filled with (condition, conclusion, symbol, symbol)
+_SETS_TRUE_OVER_FACT = "CONTRADICTION: Rule '%s => %s' tries to set %s=TRUE, but %s=FALSE is declared as initial fact"
+_SETS_FALSE_OVER_FACT = "CONTRADICTION: Rule '%s => %s' tries to set %s=FALSE, but %s=TRUE is declared as initial fact"
+_SETS_FALSE_OVER_TRUE = "CONTRADICTION: Rule '%s => %s' tries to set %s=FALSE, but %s was already determined to be TRUE (circular dependency)"
+_CONCLUDES_TRUE_OVER_FACT = "CONTRADICTION: Rule '%s => %s' concludes %s=TRUE, but %s=FALSE is declared as fact"
+_CONCLUDES_FALSE_OVER_FACT = "CONTRADICTION: Rule '%s => %s' concludes %s=FALSE, but %s=TRUE is declared as fact"
 
-def _extract_fact_symbols(cond: "exec_module.Condition") -> Set[str]:
-    """Extract all FactCondition symbols from a Condition tree."""
-    import src.exec as exec_module
-    if isinstance(cond, exec_module.FactCondition):
-        return {cond.symbol}
-    elif isinstance(cond, (exec_module.AndCondition, exec_module.OrCondition, exec_module.XorCondition)):
-        return _extract_fact_symbols(cond.left) | _extract_fact_symbols(cond.right)
-    elif isinstance(cond, exec_module.NotCondition):
-        return _extract_fact_symbols(cond.condition)
-    return set()
 
-
-def solve_symbol(ctx: "ExecContext", symbol: str, depth: int = 0) -> Status:
+def solve_symbol(ctx: "ExecContext", symbol: str) -> Status:
     """
     Decide if `symbol` is true, false, or undetermined given the rules and facts in `ctx`.
 
@@ -36,135 +37,180 @@ def solve_symbol(ctx: "ExecContext", symbol: str, depth: int = 0) -> Status:
     Args:
         ctx: Execution context
         symbol: Symbol to solve
-        depth: Recursion depth for indentation
     """
-    # 1) Check memoised status
-    status = ctx.get_status(symbol)
-
-    if status is Status.TRUE:
-        return Status.TRUE
-    if status is Status.FALSE:
-        return Status.FALSE
-    if status is Status.UNDETERMINED:
-        return Status.UNDETERMINED
-    if status is Status.IN_PROGRESS:
+    return run_steps(ctx, solve_steps(ctx, ctx.intern(symbol)))
+
+
+def run_steps(ctx: "ExecContext", steps: Generator[int, Status, Status]) -> Status:
+    """
+    Drive a solve_steps() / eval_steps() generator to completion and return its result.
+
+    Instead of recursing, a generator that needs another symbol yields its id:
+    a solve_steps() frame for that symbol goes on an explicit stack, and once it
+    returns, its status is sent back to the generator that asked for it. Proof
+    chains can then be as deep as memory allows, not as deep as the C stack.
+    """
+    stack = [steps]
+    result = None
+    while True:
+        try:
+            sid = stack[-1].send(result)
+        except StopIteration as done:
+            stack.pop()
+            result = done.value
+            if not stack:
+                return result
+        else:
+            stack.append(solve_steps(ctx, sid))
+            result = None
+
+
+def solve_steps(ctx: "ExecContext", sid: int) -> Generator[int, Status, Status]:
+    """solve_symbol() for an interned symbol, as a generator driven by run_steps()."""
+    status_table = ctx.status
+    fact_status = ctx.fact_status
+    in_progress = ctx.in_progress
+
+    # 1) Check memoised status, falling back to the initial facts when nothing is memoised yet
+    status = status_table[sid]
+    if status is not UNKNOWN:
+        # TRUE / FALSE / UNDETERMINED
+        return status
+    if in_progress[sid]:
         # We came back to the same symbol while trying to prove it -> cycle
         # Treat as undetermined since we can't resolve it
-        return Status.UNDETERMINED
+        return UNDETERMINED
 
     # 2) Base case: initial facts (both positive and negative)
-    if ctx.is_fact_true(symbol):
-        ctx.set_status(symbol, Status.TRUE)
-        return Status.TRUE
-    if ctx.is_fact_false(symbol):
-        ctx.set_status(symbol, Status.FALSE)
-        return Status.FALSE
+    status = fact_status[sid]
+    if status is not UNKNOWN:
+        status_table[sid] = status
+        return status
 
-    # 3) Mark as currently being processed (for cycle detection)
-    ctx.set_status(symbol, Status.IN_PROGRESS)
+    # 3) Mark as currently being processed (for cycle detection) while its rules are tried
+    in_progress[sid] = 1
+    status = yield from _apply_rules(ctx, sid)
+    in_progress[sid] = 0
+    return status
 
-    # 4) Try all rules that can conclude this symbol
-    rules = ctx.rules_by_conclusion.get(symbol, [])
-    for rule in rules:
-        # rule.condition is a Condition tree (AndCondition, NotCondition, etc.)
-        condition_str = format_condition(rule.condition)
-        conclusion_str = format_condition(rule.conclusion)
 
-        cond_status = eval_condition(ctx, rule.condition, depth + 1)
+def _apply_rules(ctx: "ExecContext", sid: int) -> Generator[int, Status, Status]:
+    """Try the rules concluding an unsolved symbol, on behalf of solve_steps()."""
+    status_table = ctx.status
+    fact_status = ctx.fact_status
+    in_progress = ctx.in_progress
+    symbol = ctx.symbols[sid]
 
-        if cond_status is Status.TRUE:
-            # The rule's condition is satisfied
-            import src.exec as exec_module
+    # 4) Try all rules that can conclude this symbol
+    # (every one of them lists `sid` among its conclusion symbols)
+    for meta in ctx.meta_by_conclusion[sid]:
+        # meta.condition_ops is the rule's condition compiled to postorder opcodes
+        cond_symbol = meta.condition_symbol
+        if cond_symbol < 0:
+            cond_status = yield from eval_steps(ctx, meta.condition_ops)
+        else:
+            # The condition is a lone symbol: read it in place, as eval_steps would,
+            # without starting a generator and an operand stack for it
+            cond_status = status_table[cond_symbol]
+            if cond_status is UNKNOWN:
+                if in_progress[cond_symbol]:
+                    cond_status = UNDETERMINED
+                else:
+                    cond_status = fact_status[cond_symbol]
+                    if cond_status is UNKNOWN:
+                        cond_status = yield cond_symbol
+                    else:
+                        status_table[cond_symbol] = cond_status
 
+        if cond_status is TRUE:
+            # The rule's condition is satisfied
             # Check conclusion type and handle accordingly
-            if isinstance(rule.conclusion, (exec_module.OrCondition, exec_module.XorCondition)):
+            kind = meta.conclusion_kind
+            conclusion_ids = meta.conclusion_ids
+            if kind is OrCondition or kind is XorCondition:
                 # Ambiguous conclusion: mark all symbols in the conclusion as UNDETERMINED
-                conclusion_symbols = _extract_fact_symbols(rule.conclusion)
-                for sym in conclusion_symbols:
-                    if ctx.get_status(sym) == Status.UNKNOWN or ctx.get_status(sym) == Status.IN_PROGRESS:
-                        ctx.set_status(sym, Status.UNDETERMINED)
-                # If we're solving for one of these symbols, return UNDETERMINED
-                if symbol in conclusion_symbols:
-                    return Status.UNDETERMINED
-            elif isinstance(rule.conclusion, exec_module.AndCondition):
+                for other in conclusion_ids:
+                    if status_table[other] is UNKNOWN:
+                        status_table[other] = UNDETERMINED
+                # We're solving for one of these symbols: it is UNDETERMINED
+                return UNDETERMINED
+            elif kind is AndCondition:
                 # AND conclusion: all symbols in the conclusion become TRUE
-                conclusion_symbols = _extract_fact_symbols(rule.conclusion)
-                for sym in conclusion_symbols:
-                    if ctx.get_status(sym) in (Status.UNKNOWN, Status.IN_PROGRESS):
-                        ctx.set_status(sym, Status.TRUE)
-                # If we're solving for one of these symbols, return TRUE
-                if symbol in conclusion_symbols:
-                    return Status.TRUE
-            elif isinstance(rule.conclusion, exec_module.FactCondition):
-                # Simple fact conclusion
-                if rule.conclusion.symbol == symbol:
-                    # Check for contradiction with initial facts
-                    if ctx.is_fact_false(symbol):
-                        contradiction_msg = f"CONTRADICTION: Rule '{condition_str} => {conclusion_str}' tries to set {symbol}=TRUE, but {symbol}=FALSE is declared as initial fact"
-                        ctx.add_contradiction(contradiction_msg)
-                    ctx.set_status(symbol, Status.TRUE)
-                    return Status.TRUE
-            elif isinstance(rule.conclusion, exec_module.NotCondition):
+                for other in conclusion_ids:
+                    if status_table[other] is UNKNOWN:
+                        status_table[other] = TRUE
+                # We're solving for one of these symbols: it is TRUE
+                return TRUE
+            elif kind is FactCondition:
+                # Simple fact conclusion: it is the symbol itself
+                # Check for contradiction with initial facts
+                if fact_status[sid] is FALSE:
+                    contradiction_msg = _SETS_TRUE_OVER_FACT % (meta.condition_str, meta.conclusion_str, symbol, symbol)
+                    ctx.add_contradiction(contradiction_msg)
+                status_table[sid] = TRUE
+                return TRUE
+            elif kind is NotCondition:
                 # NOT conclusion: negate the inner condition
                 # This is unusual but we can handle it
-                inner_symbols = _extract_fact_symbols(rule.conclusion.condition)
-                if symbol in inner_symbols:
-                    # If the conclusion is !A and we're querying A, A should be FALSE
-                    # Check for contradiction with initial facts or previously determined value
-                    if ctx.is_fact_true(symbol):
-                        contradiction_msg = f"CONTRADICTION: Rule '{condition_str} => {conclusion_str}' tries to set {symbol}=FALSE, but {symbol}=TRUE is declared as initial fact"
-                        ctx.add_contradiction(contradiction_msg)
-                    elif ctx.get_status(symbol) == Status.TRUE:
-                        contradiction_msg = f"CONTRADICTION: Rule '{condition_str} => {conclusion_str}' tries to set {symbol}=FALSE, but {symbol} was already determined to be TRUE (circular dependency)"
-                        ctx.add_contradiction(contradiction_msg)
-                    ctx.set_status(symbol, Status.FALSE)
-                    return Status.FALSE
-
-        elif cond_status is Status.UNDETERMINED:
+                # (the inner symbols of !X are exactly the conclusion symbols)
+                # If the conclusion is !A and we're querying A, A should be FALSE
+                # Check for contradiction with initial facts or previously determined value
+                if fact_status[sid] is TRUE:
+                    contradiction_msg = _SETS_FALSE_OVER_FACT % (meta.condition_str, meta.conclusion_str, symbol, symbol)
+                    ctx.add_contradiction(contradiction_msg)
+                elif status_table[sid] is TRUE:
+                    contradiction_msg = _SETS_FALSE_OVER_TRUE % (meta.condition_str, meta.conclusion_str, symbol, symbol)
+                    ctx.add_contradiction(contradiction_msg)
+                status_table[sid] = FALSE
+                return FALSE
+
+        elif cond_status is UNDETERMINED:
             # If any rule's condition is undetermined, the conclusion is undetermined
-            ctx.set_status(symbol, Status.UNDETERMINED)
-            return Status.UNDETERMINED
+            status_table[sid] = UNDETERMINED
+            return UNDETERMINED
         else:
             # Condition is FALSE
             # For OR/XOR conclusions, if part of the conclusion is already TRUE,
             # the implication is satisfied and other symbols are UNDETERMINED
-            import src.exec as exec_module
-            if isinstance(rule.conclusion, (exec_module.OrCondition, exec_module.XorCondition)):
-                conclusion_symbols = _extract_fact_symbols(rule.conclusion)
-                if symbol in conclusion_symbols:
-                    # Check if any other symbol in the conclusion is TRUE
-                    # We need to solve them, but avoid infinite recursion
-                    any_true = False
-                    for sym in conclusion_symbols:
-                        if sym != symbol:
-                            # Only solve if not currently being processed
-                            sym_status = ctx.get_status(sym)
-                            if sym_status == Status.IN_PROGRESS:
-                                # Skip to avoid recursion
-                                continue
-                            elif sym_status == Status.TRUE:
-                                any_true = True
-                                break
-                            elif sym_status == Status.UNKNOWN:
-                                # Try to solve it
-                                # Temporarily set current symbol to FALSE to break recursion
-                                ctx.set_status(symbol, Status.FALSE)
-                                other_status = solve_symbol(ctx, sym, depth + 1)
-                                ctx.set_status(symbol, Status.IN_PROGRESS)
-
-                                if other_status == Status.TRUE:
-                                    any_true = True
-                                    break
-
-                    if any_true:
-                        # The implication FALSE => (TRUE | symbol) is vacuously true
-                        # symbol can be either TRUE or FALSE -> UNDETERMINED
-                        ctx.set_status(symbol, Status.UNDETERMINED)
-                        return Status.UNDETERMINED
+            kind = meta.conclusion_kind
+            if kind is OrCondition or kind is XorCondition:
+                # Check if any other symbol in the conclusion is TRUE
+                # We need to solve them, but avoid infinite recursion
+                any_true = False
+                # Walk the other conclusion symbols as the set bits of the mask, lowest id first
+                others = meta.conclusion_mask & ~(1 << sid)
+                while others:
+                    bit = others & -others
+                    others ^= bit
+                    other = bit.bit_length() - 1
+                    other_status = status_table[other]
+                    if other_status is TRUE:
+                        any_true = True
+                        break
+                    elif other_status is UNKNOWN:
+                        # Only solve if not currently being processed
+                        if in_progress[other]:
+                            # Skip to avoid recursion
+                            continue
+                        # Try to solve it
+                        # Temporarily set current symbol to FALSE to break recursion
+                        status_table[sid] = FALSE
+                        other_status = yield other
+                        status_table[sid] = UNKNOWN
+
+                        if other_status is TRUE:
+                            any_true = True
+                            break
+
+                if any_true:
+                    # The implication FALSE => (TRUE | symbol) is vacuously true
+                    # symbol can be either TRUE or FALSE -> UNDETERMINED
+                    status_table[sid] = UNDETERMINED
+                    return UNDETERMINED
 
     # 5) No rule could prove this symbol
-    ctx.set_status(symbol, Status.FALSE)
-    return Status.FALSE
+    status_table[sid] = FALSE
+    return FALSE
 
 
 def run_queries(ctx: "ExecContext") -> Dict[str, Status]:
@@ -187,39 +233,36 @@ def _validate_no_contradictions(ctx: "ExecContext") -> None:
     """
     Check if any rules would contradict the initial facts.
     This is a forward pass to detect contradictions before solving queries.
-    """
-    import src.exec as exec_module
 
-    for rule in ctx.program.rules:
+    Every condition is still evaluated, in rule order: that also settles the
+    symbols the queries depend on. The conclusions are not walked again, each
+    RuleMeta already lists the literals its conclusion asserts.
+    """
+    fact_status = ctx.fact_status
+    true_mask = ctx.fact_true_mask
+    false_mask = ctx.fact_false_mask
+    for meta in ctx.rule_meta:
         # Evaluate the condition to see if this rule would fire
-        condition_status = eval_condition(ctx, rule.condition, depth=0)
-
-        if condition_status is Status.TRUE:
-            # This rule would fire - check if its conclusion contradicts facts
-            condition_str = format_condition(rule.condition)
-            conclusion_str = format_condition(rule.conclusion)
-
-            # Check conclusion for contradictions
-            def check_contradiction(conclusion: "exec_module.Condition") -> None:
-                if isinstance(conclusion, exec_module.FactCondition):
-                    # Rule concludes symbol=TRUE
-                    if ctx.is_fact_false(conclusion.symbol):
-                        msg = f"CONTRADICTION: Rule '{condition_str} => {conclusion_str}' concludes {conclusion.symbol}=TRUE, but {conclusion.symbol}=FALSE is declared as fact"
-                        ctx.add_contradiction(msg)
-                elif isinstance(conclusion, exec_module.NotCondition):
-                    # Rule concludes symbol=FALSE
-                    inner_symbols = _extract_fact_symbols(conclusion.condition)
-                    for sym in inner_symbols:
-                        if ctx.is_fact_true(sym):
-                            msg = f"CONTRADICTION: Rule '{condition_str} => {conclusion_str}' concludes {sym}=FALSE, but {sym}=TRUE is declared as fact"
-                            ctx.add_contradiction(msg)
-                elif isinstance(conclusion, exec_module.AndCondition):
-                    # All symbols in AND conclusion become TRUE
-                    check_contradiction(conclusion.left)
-                    check_contradiction(conclusion.right)
-                elif isinstance(conclusion, (exec_module.OrCondition, exec_module.XorCondition)):
-                    # These create ambiguity, not contradictions with facts
-                    # But we can still check if any branch would contradict
-                    pass
-
-            check_contradiction(rule.conclusion)
+        if meta.condition_symbol < 0:
+            condition_status = run_steps(ctx, eval_steps(ctx, meta.condition_ops))
+        else:
+            condition_status = run_steps(ctx, solve_steps(ctx, meta.condition_symbol))
+        if condition_status is not TRUE:
+            continue
+
+        # Most conclusions agree with the facts: one mask test rules them out
+        if not (meta.asserted_true_mask & false_mask or meta.asserted_false_mask & true_mask):
+            continue
+
+        # This rule would fire - check if its conclusion contradicts facts
+        for sid, value in meta.asserted_literals:
+            if value and fact_status[sid] is FALSE:
+                # Rule concludes symbol=TRUE
+                sym = ctx.symbols[sid]
+                msg = _CONCLUDES_TRUE_OVER_FACT % (meta.condition_str, meta.conclusion_str, sym, sym)
+                ctx.add_contradiction(msg)
+            elif not value and fact_status[sid] is TRUE:
+                # Rule concludes symbol=FALSE
+                sym = ctx.symbols[sid]
+                msg = _CONCLUDES_FALSE_OVER_FACT % (meta.condition_str, meta.conclusion_str, sym, sym)
+                ctx.add_contradiction(msg)
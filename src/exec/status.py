@@ -2,7 +2,15 @@ from enum import Enum, auto
 
 class Status(Enum):
     UNKNOWN = auto()
-    IN_PROGRESS = auto()
     TRUE = auto()
     FALSE = auto()
     UNDETERMINED = auto()
+
+
+# Members bound as plain module globals: on this Python, every `Status.TRUE`
+# attribute load goes through the Enum machinery, which the solver's hot
+# loops can't afford. Compare with `is` against these instead.
+UNKNOWN = Status.UNKNOWN
+TRUE = Status.TRUE
+FALSE = Status.FALSE
+UNDETERMINED = Status.UNDETERMINED
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from enum import Enum, auto
-from typing import List
+import string
+from enum import IntEnum, auto
+from typing import List, NamedTuple
 
 
-class TokenType(Enum):
-    """Types of lexemes recognized by the expert-system language."""
+class TokenType(IntEnum):
+    """
+    Types of lexemes recognized by the expert-system language.
+
+    Members are ints: the parser and validator key dicts and sets by token
+    type, and an int hashes in C where a plain Enum member runs
+    Enum.__hash__ in Python.
+    """
 
     IDENT = auto()
     AND = auto()
@@ -23,9 +29,14 @@ class TokenType(Enum):
     EOF = auto()
 
 
-@dataclass(frozen=True, slots=True)
-class Token:
-    """Represents a token with positional metadata."""
+class Token(NamedTuple):
+    """
+    Represents a token with positional metadata.
+
+    One token is built per meaningful character, so it is a NamedTuple:
+    construction is a plain tuple allocation instead of a frozen
+    dataclass __init__ going through object.__setattr__.
+    """
 
     type: TokenType
     lexeme: str
@@ -36,6 +47,22 @@ class Token:
         return f"Token({self.type.name}, {self.lexeme!r}, {self.line}:{self.column})"
 
 
+# Characters that always form a token on their own, looked up once per character
+_SINGLE_CHAR_TOKENS = {
+    "\n": TokenType.EOL,
+    "+": TokenType.AND,
+    "|": TokenType.OR,
+    "^": TokenType.XOR,
+    "!": TokenType.NOT,
+    "(": TokenType.L_PAREN,
+    ")": TokenType.R_PAREN,
+    "?": TokenType.QUERY,
+}
+# ASCII letters are identifiers too; other alphabetic characters still go through isalpha()
+_SINGLE_CHAR_TOKENS.update(dict.fromkeys(string.ascii_letters, TokenType.IDENT))
+_WHITESPACE = frozenset(" \t\r")
+
+
 class LexerError(ValueError):
     """Raised when the lexer encounters an invalid character sequence."""
 
@@ -58,39 +85,18 @@ class Lexer:
             self._mark_token_start()
             char = self._advance()
 
-            if char in {" ", "\t", "\r"}:
+            if char in _WHITESPACE:
                 continue
 
-            if char == "\n":
-                tokens.append(self._make_token(TokenType.EOL, char))
+            token_type = _SINGLE_CHAR_TOKENS.get(char)
+            if token_type is not None:
+                tokens.append(self._make_token(token_type, char))
                 continue
 
             if char == "#":
                 self._skip_comment()
                 continue
 
-            if char == "+":
-                tokens.append(self._make_token(TokenType.AND, char))
-                continue
-            if char == "|":
-                tokens.append(self._make_token(TokenType.OR, char))
-                continue
-            if char == "^":
-                tokens.append(self._make_token(TokenType.XOR, char))
-                continue
-            if char == "!":
-                tokens.append(self._make_token(TokenType.NOT, char))
-                continue
-            if char == "(":
-                tokens.append(self._make_token(TokenType.L_PAREN, char))
-                continue
-            if char == ")":
-                tokens.append(self._make_token(TokenType.R_PAREN, char))
-                continue
-            if char == "?":
-                tokens.append(self._make_token(TokenType.QUERY, char))
-                continue
-
             if char == "<":
                 if self._match("="):
                     if self._match(">"):
@@ -117,8 +123,12 @@ class Lexer:
 
     def _skip_comment(self) -> None:
         """Consume characters until the end of line or file."""
-        while not self._is_at_end() and self._peek() != "\n":
-            self._advance()
+        # A comment holds no newline, so jumping to the next one only moves the column
+        end = self.source.find("\n", self._index)
+        if end == -1:
+            end = self._length
+        self._column += end - self._index
+        self._index = end
 
     def _mark_token_start(self) -> None:
         self._start_line = self._line
@@ -140,11 +150,6 @@ class Lexer:
             self._column += 1
         return char
 
-    def _peek(self) -> str:
-        if self._is_at_end():
-            return "\0"
-        return self.source[self._index]
-
     def _match(self, expected: str) -> bool:
         if self._is_at_end():
             return False
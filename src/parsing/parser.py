@@ -15,7 +15,32 @@ from src.exec import (
 )
 
 from .lexer import Token, TokenType, lex
-from .validator import ensure_known_operator, ensure_valid_symbol, validate_balanced_parentheses
+from .validator import VALID_FACT_SYMBOLS, ensure_known_operator, ensure_valid_symbol, validate_balanced_parentheses
+
+# Token types compared on every token, bound once instead of loaded from the Enum each time
+_EOL = TokenType.EOL
+_EOF = TokenType.EOF
+_EQUAL = TokenType.EQUAL
+_QUERY = TokenType.QUERY
+_IDENT = TokenType.IDENT
+_NOT = TokenType.NOT
+_L_PAREN = TokenType.L_PAREN
+_R_PAREN = TokenType.R_PAREN
+
+# Binding strength of each binary operator token, and the node it builds
+_PRECEDENCE = {
+    TokenType.OR: 1,
+    TokenType.XOR: 2,
+    TokenType.AND: 3,
+}
+# FactCondition is frozen, so every occurrence of a symbol in every parsed program
+# shares one node; a lookup miss also means the symbol is invalid
+_FACT_CONDITIONS: Dict[str, FactCondition] = {symbol: FactCondition(symbol) for symbol in sorted(VALID_FACT_SYMBOLS)}
+_BINARY_CONDITIONS = {
+    TokenType.OR: OrCondition,
+    TokenType.XOR: XorCondition,
+    TokenType.AND: AndCondition,
+}
 
 
 @dataclass(slots=True)
@@ -68,6 +93,9 @@ class Parser:
 
     def __init__(self, tokens: Sequence[Token]):
         self.tokens = tokens
+        # Token types in a parallel list: the parse loops only compare types,
+        # a Token is only fetched when its lexeme or position is needed
+        self._types = [token.type for token in tokens]
         self.current = 0
 
     def parse(self) -> Program:
@@ -79,18 +107,23 @@ class Parser:
         facts_started = False
         queries_started = False
 
-        while not self._is_at_end():
-            if self._match(TokenType.EOL):
+        types = self._types
+        while True:
+            token_type = types[self.current]
+            if token_type is _EOF:
+                break
+            if token_type is _EOL:
+                self.current += 1
                 continue
 
-            if self._check(TokenType.EQUAL):
+            if token_type is _EQUAL:
                 if queries_started:
                     raise self._error("Facts must be declared before queries.")
                 facts_started = True
                 facts.update(self._parse_fact_line())
                 continue
 
-            if self._check(TokenType.QUERY):
+            if token_type is _QUERY:
                 queries_started = True
                 queries.extend(self._parse_query_line())
                 continue
@@ -111,30 +144,39 @@ class Parser:
 
     def _parse_fact_line(self) -> Dict[str, bool]:
         self._consume(TokenType.EQUAL, "Expected '=' at the beginning of the facts line.")
-        line_facts: Dict[str, bool] = {}
-
-        while not self._check(TokenType.EOL) and not self._check(TokenType.EOF):
-            token = self._consume(TokenType.IDENT, "Expected a fact symbol.")
-            symbol = ensure_valid_symbol(token.lexeme, token)
-            line_facts[symbol] = True
-
+        line_facts = dict.fromkeys(self._parse_symbols("Expected a fact symbol."), True)
         self._consume_line_breaks()
         return line_facts
 
     def _parse_query_line(self) -> List[str]:
         self._consume(TokenType.QUERY, "Expected '?' at the beginning of the queries line.")
-        result: List[str] = []
-
-        while not self._check(TokenType.EOL) and not self._check(TokenType.EOF):
-            token = self._consume(TokenType.IDENT, "Expected a query symbol.")
-            symbol = ensure_valid_symbol(token.lexeme, token)
-            result.append(symbol)
-
+        result = self._parse_symbols("Expected a query symbol.")
         self._consume_line_breaks()
         if not result:
             raise ParserError("Query line must contain at least one query symbol.")
         return result
 
+    def _parse_symbols(self, message: str) -> List[str]:
+        """Read the fact symbols up to the end of the line, raising `message` on anything else."""
+        tokens = self.tokens
+        types = self._types
+        symbols: List[str] = []
+        index = self.current
+        # The line must end with a line break: reaching EOF first is an error as well
+        while types[index] is not _EOL:
+            if types[index] is not _IDENT:
+                self.current = index
+                raise self._error(message)
+            token = tokens[index]
+            # A valid symbol is its own normalised form: ensure_valid_symbol only runs to report a bad one
+            symbol = token.lexeme
+            if symbol not in VALID_FACT_SYMBOLS:
+                symbol = ensure_valid_symbol(symbol, token)
+            symbols.append(symbol)
+            index += 1
+        self.current = index
+        return symbols
+
     def _parse_rule(self) -> List[Rule]:
         """
         Parses a rule line, handling both unidirectional ('=>') and bidirectional ('<=>') operators.
@@ -152,7 +194,8 @@ class Parser:
             operator = self._previous()
             conclusion_expr = self._parse_expression()
             self._consume_line_breaks()
-            return [Rule(condition=left_expression, conclusion=conclusion_expr, line=operator.line)]
+            # Rule(condition, conclusion, line), positional: keyword arguments double the construction cost
+            return [Rule(left_expression, conclusion_expr, operator.line)]
 
         if self._match(TokenType.IIF):
             # Biconditional: A <=> B means A => B AND B => A
@@ -160,8 +203,8 @@ class Parser:
             right_expression = self._parse_expression()
             self._consume_line_breaks()
             return [
-                Rule(condition=left_expression, conclusion=right_expression, line=operator.line),
-                Rule(condition=right_expression, conclusion=left_expression, line=operator.line),
+                Rule(left_expression, right_expression, operator.line),
+                Rule(right_expression, left_expression, operator.line),
             ]
 
         raise self._error("Expected '=>' or '<=>' after the rule condition.")
@@ -171,56 +214,76 @@ class Parser:
         Parses a boolean expression consisting of fact symbols, parentheses, and logical operators
         (AND, OR, XOR, NOT). Expressions may be nested using parentheses and combined using
         the supported operators. Returns a Condition object representing the parsed expression.
+
+        Operators are resolved by precedence climbing over explicit stacks (OR < XOR < AND < NOT,
+        binary operators grouping to the left), so neither long chains nor deeply nested
+        parentheses grow the Python call stack.
         """
-        return self._parse_or()
-
-    def _parse_or(self) -> Condition:
-        expression = self._parse_xor()
-        while self._match(TokenType.OR):
-            ensure_known_operator(self._previous())
-            right = self._parse_xor()
-            expression = OrCondition(expression, right)
-        return expression
-
-    def _parse_xor(self) -> Condition:
-        expression = self._parse_and()
-        while self._match(TokenType.XOR):
-            ensure_known_operator(self._previous())
-            right = self._parse_and()
-            expression = XorCondition(expression, right)
-        return expression
-
-    def _parse_and(self) -> Condition:
-        expression = self._parse_unary()
-        while self._match(TokenType.AND):
-            ensure_known_operator(self._previous())
-            right = self._parse_unary()
-            expression = AndCondition(expression, right)
-        return expression
-
-    def _parse_unary(self) -> Condition:
-        if self._match(TokenType.NOT):
-            ensure_known_operator(self._previous())
-            operand = self._parse_unary()
-            return NotCondition(operand)
-        return self._parse_primary()
-
-    def _parse_primary(self) -> Condition:
-        if self._match(TokenType.IDENT):
-            token = self._previous()
-            symbol = ensure_valid_symbol(token.lexeme, token)
-            return FactCondition(symbol)
-
-        if self._match(TokenType.L_PAREN):
-            expression = self._parse_expression()
-            self._consume(TokenType.R_PAREN, "Expected ')' after expression.")
-            return expression
-
-        raise self._error("Expected a fact symbol or '('.")
+        tokens = self.tokens
+        types = self._types
+        operands: List[Condition] = []
+        # Pending NOT and binary operator types, and an L_PAREN marker per open parenthesis
+        operators: List[TokenType] = []
+
+        while True:
+            # Operand position: any number of '!' and '(' before a fact symbol
+            token_type = types[self.current]
+            if token_type is _NOT:
+                ensure_known_operator(tokens[self.current])
+                self.current += 1
+                operators.append(_NOT)
+                continue
+            if token_type is _L_PAREN:
+                self.current += 1
+                operators.append(_L_PAREN)
+                continue
+            if token_type is not _IDENT:
+                raise self._error("Expected a fact symbol or '('.")
+            token = tokens[self.current]
+            self.current += 1
+            operand: Condition | None = _FACT_CONDITIONS.get(token.lexeme)
+            if operand is None:
+                # Not one of the 26 symbols: always raises
+                operand = FactCondition(ensure_valid_symbol(token.lexeme, token))
+
+            # Operator position: close parentheses until a binary operator or the end of the expression
+            while True:
+                while operators and operators[-1] is _NOT:
+                    operators.pop()
+                    operand = NotCondition(operand)
+                operands.append(operand)
+
+                token_type = types[self.current]
+                precedence = _PRECEDENCE.get(token_type)
+                if precedence is not None:
+                    # Left-associative: fold the pending operators that bind at least as tightly
+                    while operators and operators[-1] is not _L_PAREN and _PRECEDENCE[operators[-1]] >= precedence:
+                        right = operands.pop()
+                        operands[-1] = _BINARY_CONDITIONS[operators.pop()](operands[-1], right)
+                    ensure_known_operator(tokens[self.current])
+                    self.current += 1
+                    operators.append(token_type)
+                    break
+
+                while operators and operators[-1] is not _L_PAREN:
+                    right = operands.pop()
+                    operands[-1] = _BINARY_CONDITIONS[operators.pop()](operands[-1], right)
+                if not operators:
+                    return operands.pop()
+
+                # The innermost parenthesis ends here; its contents become an operand
+                if token_type is not _R_PAREN:
+                    raise self._error("Expected ')' after expression.")
+                self.current += 1
+                operators.pop()
+                operand = operands.pop()
 
     def _consume_line_breaks(self) -> None:
-        while self._match(TokenType.EOL):
-            continue
+        types = self._types
+        index = self.current
+        while types[index] is _EOL:
+            index += 1
+        self.current = index
 
     def _consume(self, token_type: TokenType, message: str) -> Token:
         if self._check(token_type):
@@ -229,18 +292,17 @@ class Parser:
 
     def _match(self, token_type: TokenType) -> bool:
         if self._check(token_type):
-            self._advance()
+            self.current += 1
             return True
         return False
 
     def _check(self, token_type: TokenType) -> bool:
-        if self._is_at_end():
-            return False
-        return self._peek().type == token_type
+        current_type = self._types[self.current]
+        return current_type is token_type and current_type is not _EOF
 
     def _advance(self) -> Token:
         token = self.tokens[self.current]
-        if not self._is_at_end():
+        if self._types[self.current] is not _EOF:
             self.current += 1
         return token
 
@@ -251,7 +313,7 @@ class Parser:
         return self.tokens[self.current - 1]
 
     def _is_at_end(self) -> bool:
-        return self._peek().type == TokenType.EOF
+        return self._types[self.current] is _EOF
 
     def _error(self, message: str) -> ParserError:
         token = self._peek() if not self._is_at_end() else None
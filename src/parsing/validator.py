@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from itertools import accumulate
+from operator import attrgetter
 from typing import Iterable, Sequence
 
 from .lexer import Token, TokenType
@@ -17,6 +19,12 @@ ALLOWED_OPERATORS = frozenset(
     }
 )
 
+# Nesting change of each token type: +1 for '(', -1 for ')', 0 for everything else
+_PAREN_DELTA = dict.fromkeys(TokenType, 0)
+_PAREN_DELTA[TokenType.L_PAREN] = 1
+_PAREN_DELTA[TokenType.R_PAREN] = -1
+_token_type = attrgetter("type")
+
 
 class ValidationError(ValueError):
     """Raised when a syntactic validation rule fails."""
@@ -24,6 +32,9 @@ class ValidationError(ValueError):
 
 def ensure_valid_symbol(symbol: str, token: Token | None = None) -> str:
     """Validate and normalize a fact symbol."""
+    if symbol in VALID_FACT_SYMBOLS:
+        # Already a single uppercase letter, as the lexer produces for valid input
+        return symbol
     cleaned = symbol.strip()
     if len(cleaned) != 1 or cleaned.upper() not in VALID_FACT_SYMBOLS:
         location = f" at line {token.line}, column {token.column}" if token else ""
@@ -40,7 +51,12 @@ def ensure_valid_symbol(symbol: str, token: Token | None = None) -> str:
 
 def validate_balanced_parentheses(tokens: Sequence[Token]) -> None:
     """Ensure that parentheses are balanced across the token stream."""
-    depth = 0
+    # Balanced iff the running nesting depth never drops below zero and ends at zero:
+    # map/accumulate/min run that scan in C, the loop below only locates an error
+    depths = list(accumulate(map(_PAREN_DELTA.__getitem__, map(_token_type, tokens))))
+    if not depths or (min(depths) >= 0 and depths[-1] == 0):
+        return
+
     lparen_stack = []
     for token in tokens:
         if token.type == TokenType.L_PAREN:
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, List
+import os
+import sys
+from typing import TYPE_CHECKING, Dict, List
 
-from src.parsing import Program
+if TYPE_CHECKING:
+    from src.parsing import Program
+
+
+logger = logging.getLogger(__name__)
 
 
 # Color constants - centralized for the entire project
@@ -30,6 +36,21 @@ class Colors:
         return f"{color}{text}{cls.RESET}"
 
 
+def _colors_enabled() -> bool:
+    """Colors are only worth their bytes on a terminal, and NO_COLOR (https://no-color.org) turns them off."""
+    if os.environ.get("NO_COLOR"):
+        return False
+    stream = sys.stdout
+    return stream is not None and stream.isatty()
+
+
+# Piped or redirected output gets no escape codes at all. This runs before any
+# other module copies the codes into its own constants.
+if not _colors_enabled():
+    for _name in ("RESET", "GREEN", "RED", "YELLOW", "BLUE", "CYAN", "MAGENTA", "WHITE", "BOLD"):
+        setattr(Colors, _name, "")
+
+
 # Legacy constants for backward compatibility
 RESET = Colors.RESET
 CYAN = Colors.CYAN
@@ -38,64 +59,76 @@ WHITE = Colors.WHITE
 MAGENTA = Colors.MAGENTA
 
 
-def _color(text: str, color: str) -> str:
-    return Colors.color(text, color)
+# Colored summary lines, built once: the fixed ones are used as is, the
+# %-templates only get their variable parts formatted per line
+_PARSING_HEADER = f"{MAGENTA}Parsing summary{RESET}"
+_NO_RULES = f"{WHITE}    (none){RESET}"
+_NO_FACTS = f"{CYAN}  Facts: (none){RESET}"
+_RULES_COUNT = f"{CYAN}  Rules (%d):{RESET}"
+# Rule lines take two passes: the index width first ("%%0%dd" % 3 -> "%03d"), then each rule
+_RULE_LINE = f"{WHITE}    [%%0%dd] line %%d -> %%s => %%s{RESET}"
+_FACTS_COUNT = f"{CYAN}  Facts (%d):{RESET}"
+_TRUE_FACTS = f"{YELLOW}    true : %s{RESET}"
+_FALSE_FACTS = f"{YELLOW}    false: %s{RESET}"
+_QUERIES_LINE = f"{CYAN}  Queries (%d): %s{RESET}"
 
 
-def log_program(program: Program) -> None:
+def log_program(program: "Program") -> None:
     """Emit a detailed log of the rules, facts, and queries."""
-    logging.info("")
-    logging.info(_color("Parsing summary", MAGENTA))
-    _log_rules(program)
-    logging.info("")
-    _log_facts(program.facts)
-    logging.info("")
-    _log_queries(program.queries)
-    logging.info("")
+    # Nothing below is needed when INFO records are dropped: skip formatting and sorting altogether
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    lines: List[str] = ["", _PARSING_HEADER]
+    _rule_lines(program, lines)
+    lines.append("")
+    _fact_lines(program.facts, lines)
+    lines.append("")
+    _query_lines(program.queries, lines)
+    lines.append("")
+
+    # Still one record per line: the handler prefixes and colors each record on its own
+    info = logger.info
+    for line in lines:
+        info(line)
 
 
-def _log_rules(program: Program) -> None:
+def _rule_lines(program: "Program", lines: List[str]) -> None:
     rules = program.rules
-    logging.info(_color(f"  Rules ({len(rules)}):", CYAN))
+    lines.append(_RULES_COUNT % len(rules))
     if not rules:
-        logging.info(_color("    (none)", WHITE))
+        lines.append(_NO_RULES)
         return
 
-    width = len(str(len(rules)))
+    rule_line = _RULE_LINE % len(str(len(rules)))
     for index, rule in enumerate(rules, 1):
-        label = str(rule.condition)
-        # Conclusion can now be any Condition, not just FactCondition
-        conclusion_str = getattr(rule.conclusion, 'rule_format', None) or str(rule.conclusion)
-        logging.info(
-            _color(
-                f"    [{index:0{width}d}] line {rule.line} -> {label} => {conclusion_str}",
-                WHITE,
-            )
-        )
-
-
-def _log_facts(facts: Dict[str, bool]) -> None:
+        # Both labels are the rule_format each Condition computes once when it is built
+        # (the conclusion can be any Condition, not just FactCondition)
+        lines.append(rule_line % (index, rule.line, rule.condition, rule.conclusion))
+
+
+def _fact_lines(facts: Dict[str, bool], lines: List[str]) -> None:
     if not facts:
-        logging.info(_color("  Facts: (none)", CYAN))
+        lines.append(_NO_FACTS)
         return
 
-    true_facts = sorted(symbol for symbol, value in facts.items() if value)
-    false_facts = sorted(symbol for symbol, value in facts.items() if not value)
+    # Split the facts by value in a single walk over the dict, then sort each side
+    true_facts: List[str] = []
+    false_facts: List[str] = []
+    for symbol, value in facts.items():
+        (true_facts if value else false_facts).append(symbol)
+    true_facts.sort()
+    false_facts.sort()
 
-    logging.info(_color(f"  Facts ({len(facts)}):", CYAN))
+    lines.append(_FACTS_COUNT % len(facts))
     if true_facts:
-        logging.info(_color(f"    true : {' '.join(true_facts)}", YELLOW))
+        lines.append(_TRUE_FACTS % " ".join(true_facts))
     if false_facts:
-        logging.info(_color(f"    false: {' '.join(false_facts)}", YELLOW))
+        lines.append(_FALSE_FACTS % " ".join(false_facts))
 
 
-def _log_queries(queries: List[str]) -> None:
-    logging.info(
-        _color(
-            f"  Queries ({len(queries)}): {(' '.join(queries) or '(none)')}",
-            CYAN,
-        )
-    )
+def _query_lines(queries: List[str], lines: List[str]) -> None:
+    lines.append(_QUERIES_LINE % (len(queries), " ".join(queries) or "(none)"))
 
 
 __all__ = ["log_program", "Colors"]